@@ -1,6 +1,7 @@
 """Static assets for beodata package."""
 
 from assets.loader import (
+    clear_asset_cache,
     get_asset_path,
     open_asset,
     read_asset_bytes,
@@ -8,6 +9,7 @@ from assets.loader import (
 )
 
 __all__ = [
+    "clear_asset_cache",
     "get_asset_path",
     "open_asset",
     "read_asset_bytes",
@@ -1,5 +1,6 @@
 """Asset loading utilities using importlib.resources."""
 
+from functools import lru_cache
 from importlib.resources import as_file, files
 from pathlib import Path
 from typing import Iterator
@@ -7,7 +8,12 @@ from typing import Iterator
 # Reference to the assets package
 _ASSETS = files("assets")
 
+# Assets are static for the life of the process, so resolved paths and
+# contents are memoized (see clear_asset_cache())
+_CACHE_SIZE = 32
 
+
+@lru_cache(maxsize=_CACHE_SIZE)
 def get_asset_path(filename: str) -> Path:
     """
     Get the path to an asset file.
@@ -43,6 +49,7 @@ def open_asset(filename: str, mode: str = "r") -> Iterator:
     return _ASSETS.joinpath(filename).open(mode)
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def read_asset_text(filename: str) -> str:
     """
     Read an asset file as text.
@@ -56,6 +63,7 @@ def read_asset_text(filename: str) -> str:
     return _ASSETS.joinpath(filename).read_text()
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def read_asset_bytes(filename: str) -> bytes:
     """
     Read an asset file as bytes.
@@ -67,3 +75,10 @@ def read_asset_bytes(filename: str) -> bytes:
         Contents of the file as bytes
     """
     return _ASSETS.joinpath(filename).read_bytes()
+
+
+def clear_asset_cache() -> None:
+    """Forget memoized asset paths and contents (e.g. after an asset changes)."""
+    get_asset_path.cache_clear()
+    read_asset_text.cache_clear()
+    read_asset_bytes.cache_clear()
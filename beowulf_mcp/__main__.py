@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from logging_config import get_logger
 from sources.abbreviations import Abbreviations
 from sources.analytical_lexicon import AnalyticalLexicon
@@ -31,10 +33,11 @@ SOURCES = [
 
 class Beodata:
     def __repr__(self) -> str:
+        loaded = self.__dict__
         attrs = [
-            f"  .{name} ({type(getattr(self, name)).__name__})"
+            f"  .{name} ({type(loaded[name]).__name__})"
             for _, name in SOURCES
-            if hasattr(self, name)
+            if name in loaded
         ]
         return "beodata namespace:\n" + "\n".join(attrs)
 
@@ -42,9 +45,12 @@ class Beodata:
 def repl() -> Beodata:
     ns = Beodata()
     ns.logger = get_logger()
-    for cls, name in SOURCES:
-        obj = cls()
-        obj.load()
+    objs = [cls() for cls, _ in SOURCES]
+    # Each source loads its own table over its own connection, and several
+    # wait on the network or on lxml, so load them side by side
+    with ThreadPoolExecutor(max_workers=len(objs)) as executor:
+        list(executor.map(lambda obj: obj.load(), objs))
+    for (_, name), obj in zip(SOURCES, objs):
         setattr(ns, name, obj)
     print("Beodata loaded! To run repl: ")
     print("  poetry run python -i repl")
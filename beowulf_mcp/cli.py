@@ -1,22 +1,36 @@
 """Command-line entry points for beodata."""
 
+import hashlib
+import json
+import os
+import sys
+from functools import lru_cache
 from pathlib import Path
-
-import requests
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 from logging_config import get_logger
-from sources.abbreviations import Abbreviations
-from sources.bosworth import BosworthToller
+from sources.abbreviations import get_abbreviations
+from sources.bosworth import get_bt
 from sources.brunetti import Brunetti
 from sources.heorot import HEOROT_URL, Heorot, parse
 from text.models import dict_data_to_beowulf_lines
-from writers import get_all_writers
+
+if TYPE_CHECKING:
+    import requests
 
 # Define the data directory relative to this file (for test and output data)
 DATA_DIR = Path(__file__).parents[1] / "output"
 
 logger = get_logger()
 
+# Seconds to wait on connect/read when fetching source HTML
+FETCH_TIMEOUT = 30
+# Bytes per chunk when streaming a fetched page to disk
+FETCH_CHUNK_SIZE = 65536
+
+# Bump when parse() output changes, so cached parsed lines are rebuilt
+PARSE_CACHE_VERSION = 4
+
 
 def fetch_store_parse_and_write(output_file_stem: str, url: str):
     parsed_lines = fetch_store_and_parse("maintext", HEOROT_URL)
@@ -35,7 +49,8 @@ def fetch_store_and_parse(output_file_stem: str, url: str) -> list:
         List of parsed line dictionaries
     """
     html = fetch_and_store(url, f"{output_file_stem}.html")
-    parsed_lines = parse(html)
+    # Copies, so callers can't alter the lines memoized for later calls
+    parsed_lines = [dict(line) for line in _parsed_lines(output_file_stem, html)]
     logger.info(
         "parsed the file",
         output_file_stem=output_file_stem,
@@ -46,40 +61,209 @@ def fetch_store_and_parse(output_file_stem: str, url: str) -> list:
     return parsed_lines
 
 
-def fetch_and_store(url: str, filename: str) -> str:
+@lru_cache(maxsize=4)
+def _parsed_lines(output_file_stem: str, html: str) -> Tuple[Dict[str, Any], ...]:
+    """
+    Parsed lines for this HTML, memoized in-process on top of the disk cache.
+
+    fetch_and_store() hands back the same memoized HTML string each time, and
+    str caches its hash, so repeat lookups don't rehash the page.
+    """
+    return tuple(_parse_cached(output_file_stem, html))
+
+
+def _parse_cached(output_file_stem: str, html: str) -> list:
+    """
+    Parse HTML, reusing the lines stored by a previous run for the same HTML.
+
+    The parsed lines are stored as {stem}.lines.json next to the HTML, with a
+    sidecar {stem}.lines.sha256 holding the hash of the HTML they came from.
+    A missing or mismatched hash means the HTML (or PARSE_CACHE_VERSION)
+    changed, so the HTML is parsed again and the cache rewritten.
+
+    Args:
+        output_file_stem: Base name of the stored HTML file
+        html: HTML content to parse
+
+    Returns:
+        List of parsed line dictionaries
+    """
+    lines_path = DATA_DIR / f"{output_file_stem}.lines.json"
+    sha_path = DATA_DIR / f"{output_file_stem}.lines.sha256"
+    digest = hashlib.sha256(
+        f"{PARSE_CACHE_VERSION}\n{html}".encode("utf-8")
+    ).hexdigest()
+
+    if (
+        lines_path.exists()
+        and sha_path.exists()
+        and sha_path.read_text(encoding="utf-8") == digest
+    ):
+        logger.info("Parsed lines are cached, skipping parse", file=lines_path.name)
+        with lines_path.open("r", encoding="utf-8") as file:
+            return json.load(file)
+
+    parsed_lines = parse(html)
+    # Lines first, hash last: a hash only ever vouches for a complete lines file
+    _write_atomic(lines_path, json.dumps(parsed_lines, ensure_ascii=False))
+    _write_atomic(sha_path, digest)
+    return parsed_lines
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write text to a temporary file and move it over path in one step."""
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+@lru_cache(maxsize=8)
+def fetch_and_store(url: str, filename: str, encoding: Optional[str] = None) -> str:
     """
     Fetch HTML content from URL and store locally if not already present.
 
+    The content is also kept in memory, so repeated calls in the same process
+    neither refetch nor reread the stored file.
+
     Args:
         url: The URL to fetch content from
         filename: Local file path to store the content
+        encoding: Charset to decode the response with, for servers that don't
+            declare the right one. Defaults to what the response declares.
 
     Returns:
         The HTML content as a string
 
     Raises:
         requests.RequestException: If the HTTP request fails
+        RuntimeError: If the server answers 304 to the unconditional request
     """
     file_path = DATA_DIR / Path(filename).name
     if not file_path.exists():
         logger.info("Fetching HTML", url=url, file=file_path.name)
-        response = requests.get(url)
-        response.raise_for_status()
+        text = _download(url, file_path, encoding=encoding)
+        if text is None:
+            # No validators were sent, so a conforming server never answers 304
+            raise RuntimeError(f"Unexpected 304 Not Modified from {url}")
+        return text
+
+    logger.info("HTML is already stored locally, skipping HTTP fetch")
+    return file_path.read_text(encoding="utf-8")
+
+
+def refresh_stored(url: str, filename: str) -> str:
+    """
+    Revalidate a stored page with the server, refetching only if it changed.
+
+    Sends the ETag / Last-Modified saved when the page was fetched, so an
+    unchanged page costs a bodiless 304 response. fetch_and_store() itself
+    never goes to the network once the page is stored.
+
+    Args:
+        url: The URL the content came from
+        filename: Local file path the content is stored at
+
+    Returns:
+        The current HTML content as a string
+
+    Raises:
+        requests.RequestException: If the HTTP request fails
+    """
+    file_path = DATA_DIR / Path(filename).name
+    headers = {}
+    if file_path.exists():
+        meta = _read_fetch_meta(file_path)
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    logger.info("Revalidating stored HTML", url=url, file=file_path.name)
+    text = _download(url, file_path, headers)
+    if text is None:
+        logger.info("Stored HTML is current", file=file_path.name)
+        text = file_path.read_text(encoding="utf-8")
+    fetch_and_store.cache_clear()
+    return text
+
+
+def _download(
+    url: str,
+    file_path: Path,
+    headers: Optional[Dict[str, str]] = None,
+    encoding: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Stream url to file_path and remember its cache validators.
 
-        with file_path.open("w", encoding="utf-8") as file:
-            file.write(response.text)
-            return response.text
-    else:
-        logger.info("HTML is already stored locally, skipping HTTP fetch")
-        with file_path.open("r", encoding="utf-8") as file:
-            logger.debug(
-                "File opened successfully, reading content...", file=file_path.name
-            )
-            return file.read()
+    Returns:
+        The content as a string, or None if the server answered 304 Not Modified
+    """
+    parts = []
+    tmp_path = file_path.with_name(f"{file_path.name}.tmp")
+    with _http_session().get(
+        url, headers=headers, stream=True, timeout=FETCH_TIMEOUT
+    ) as response:
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()
+        if encoding:
+            response.encoding = encoding
+        # Written to a temporary file and moved into place once complete, so a
+        # failed download never leaves a truncated page to be read as stored
+        try:
+            with tmp_path.open("w", encoding="utf-8") as file:
+                if response.encoding is None:
+                    # No charset to stream with: .text falls back to apparent_encoding
+                    parts.append(response.text)
+                    file.write(parts[0])
+                else:
+                    for chunk in response.iter_content(
+                        chunk_size=FETCH_CHUNK_SIZE, decode_unicode=True
+                    ):
+                        file.write(chunk)
+                        parts.append(chunk)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        meta = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+    _write_atomic(_fetch_meta_path(file_path), json.dumps(meta))
+    return "".join(parts)
+
+
+def _fetch_meta_path(file_path: Path) -> Path:
+    """Sidecar holding the ETag / Last-Modified of a stored page."""
+    return file_path.with_name(f"{file_path.name}.meta.json")
+
+
+def _read_fetch_meta(file_path: Path) -> Dict[str, Optional[str]]:
+    """Cache validators saved for a stored page, or {} if none were saved."""
+    meta_path = _fetch_meta_path(file_path)
+    if not meta_path.exists():
+        return {}
+    with meta_path.open("r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+@lru_cache(maxsize=1)
+def _http_session() -> "requests.Session":
+    """Shared HTTP session, so repeated fetches reuse pooled connections."""
+    # Imported here: the MCP server imports this module but almost always
+    # hits the stored file, so it shouldn't pay for loading requests
+    import requests
+
+    return requests.Session()
 
 
 def call_output_writers(output_file_stem: str, parsed_lines: list[dict] = []) -> None:
     """Write parsed lines using all registered writers."""
+    # Imported here so that importing the CLI doesn't load pysubs2 and friends
+    from writers import get_all_writers
+
     for writer in get_all_writers():
         output_path = writer.get_output_path(DATA_DIR, output_file_stem)
         writer.write(parsed_lines, output_path)
@@ -94,7 +278,14 @@ def model_dump() -> None:
 
 
 def load_heorot() -> None:
-    """Main function to process and load the Beowulf text from heorot.dk."""
+    """
+    Main function to process and load the Beowulf text from heorot.dk.
+
+    With --refresh, the stored page is first revalidated with heorot.dk and
+    refetched if it changed; otherwise a stored page is used as-is.
+    """
+    if "--refresh" in sys.argv[1:]:
+        refresh_stored(HEOROT_URL, "maintext.html")
     # Write to JSON/CSV/ASS files
     fetch_store_parse_and_write("maintext", HEOROT_URL)
     # Also persist to DuckDB
@@ -105,14 +296,12 @@ def load_heorot() -> None:
 
 def load_bosworth() -> None:
     """Main function to process and load the Bosworth-Toller dictionary from csv."""
-    bt = BosworthToller()
-    bt.load(force=True)
+    get_bt().load(force=True)
 
 
 def load_abbreviations() -> None:
     """Main function to process and load the abbreviation dictionary from XML."""
-    abbr = Abbreviations()
-    abbr.load(force=True)
+    get_abbreviations().load(force=True)
 
 
 def load_brunetti() -> None:
@@ -1,8 +1,10 @@
 """Database management for beodata DuckDB instance."""
 
+import atexit
 import os
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import duckdb
 from dotenv import load_dotenv
@@ -40,6 +42,8 @@ class BeoDB:
         """
         self.db_path = db_path or DEFAULT_DB_PATH
         self._conn: Optional[duckdb.DuckDBPyConnection] = None
+        self._statements: dict[str, duckdb.Statement] = {}
+        self._schema_cache: dict[str, dict[str, str]] = {}
         logger.debug("BeoDB initialized", db_path=str(self.db_path))
 
     @property
@@ -55,6 +59,8 @@ class BeoDB:
         if self._conn is not None:
             self._conn.close()
             self._conn = None
+            self._statements.clear()
+            self._schema_cache.clear()
             logger.debug("DuckDB connection closed")
 
     def __enter__(self) -> "BeoDB":
@@ -63,51 +69,115 @@ class BeoDB:
     def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
         self.close()
 
+    @contextmanager
+    def transaction(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """
+        Run the enclosed statements as a single transaction.
+
+        Commits on success and rolls back if the block raises, so bulk loads
+        pay for one commit instead of one per statement.
+
+        Yields:
+            The open DuckDB connection.
+        """
+        conn = self.conn
+        conn.execute("BEGIN TRANSACTION")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
     def table_exists(self, table_name: str) -> bool:
         """Check if a table exists in the database."""
+        # duckdb_tables() reads the catalog directly; LIMIT 1 stops at the first hit
         result = self.conn.execute(
-            "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ?",
+            self.prepare("SELECT 1 FROM duckdb_tables() WHERE table_name = ? LIMIT 1"),
             [table_name],
         ).fetchone()
-        return result is not None and result[0] > 0
+        return result is not None
 
     def get_schema(self, table_name: str) -> dict[str, str]:
-        """Get the schema of a table as {column_name: data_type}."""
-        result = self.conn.execute(
-            "SELECT column_name, data_type FROM information_schema.columns "
-            "WHERE table_name = ? ORDER BY ordinal_position",
-            [table_name],
-        ).fetchall()
-        logger.info("Schema fetched!")
-        return {row[0]: row[1] for row in result}
+        """
+        Get the schema of a table as {column_name: data_type}.
+
+        The catalog is queried once per table; the result is cached until the
+        table is dropped through drop_table() or the connection is closed.
+        Missing tables are not cached, so they are seen once created.
+        """
+        schema = self._schema_cache.get(table_name)
+        if schema is None:
+            result = self.conn.execute(
+                self.prepare(
+                    "SELECT column_name, data_type FROM information_schema.columns "
+                    "WHERE table_name = ? ORDER BY ordinal_position"
+                ),
+                [table_name],
+            ).fetchall()
+            logger.debug("Schema fetched!")
+            schema = {row[0]: row[1] for row in result}
+            if schema:
+                self._schema_cache[table_name] = schema
+        return dict(schema)
 
     def get_columns(self, table_name: str) -> list[str]:
-        """Get the column names of a table."""
-        result = self.conn.execute(
-            "SELECT column_name FROM information_schema.columns "
-            "WHERE table_name = ? ORDER BY ordinal_position",
-            [table_name],
-        ).fetchall()
-        return [row[0] for row in result]
+        """Get the column names of a table (cached, see get_schema())."""
+        return list(self.get_schema(table_name))
+
+    def prepare(self, sql: str) -> duckdb.Statement:
+        """
+        Parse a single SQL statement once and reuse it on later calls.
+
+        Executing the returned statement skips DuckDB's parser, which dominates
+        the cost of cheap, frequently repeated lookups.
+
+        Args:
+            sql: A single SQL statement, optionally with ? parameters.
+
+        Returns:
+            The parsed statement, to pass to conn.execute() with parameters.
+        """
+        statement = self._statements.get(sql)
+        if statement is None:
+            (statement,) = self.conn.extract_statements(sql)
+            self._statements[sql] = statement
+        return statement
+
+    def fetch_dicts(self, sql: str, params: Optional[list] = None) -> list[dict]:
+        """
+        Run a query and return its rows as dictionaries keyed by column name.
+
+        Column names come from the result itself, so no catalog lookup is needed,
+        and the statement is parsed only once per distinct query (see prepare()).
+        """
+        cursor = self.conn.execute(self.prepare(sql), params or [])
+        columns = [col[0] for col in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
 
     def drop_table(self, table_name: str) -> None:
         """Drop a table if it exists."""
         # Use safe quoting for table name
         safe_name = _quote_identifier(table_name)
         self.conn.execute(f"DROP TABLE IF EXISTS {safe_name}")
+        self._schema_cache.pop(table_name, None)
         logger.info("Dropped table", table_name=table_name)
 
     def count(self, table_name: str) -> int:
         """Return the number of rows in a table."""
         safe_name = _quote_identifier(table_name)
-        result = self.conn.execute(f"SELECT COUNT(*) FROM {safe_name}").fetchone()
+        result = self.conn.execute(
+            self.prepare(f"SELECT COUNT(*) FROM {safe_name}")
+        ).fetchone()
         return result[0] if result else 0
 
     def list_tables(self) -> list[str]:
         """List all tables in the database."""
         result = self.conn.execute(
-            "SELECT table_name FROM information_schema.tables "
-            "WHERE table_schema = 'main' ORDER BY table_name"
+            self.prepare(
+                "SELECT table_name FROM information_schema.tables "
+                "WHERE table_schema = 'main' ORDER BY table_name"
+            )
         ).fetchall()
         return [row[0] for row in result]
 
@@ -131,6 +201,8 @@ def get_db() -> BeoDB:
     global _default_db
     if _default_db is None:
         _default_db = BeoDB()
+        # Close the shared connection on interpreter exit (idempotent)
+        atexit.register(reset_db)
     return _default_db
 
 
@@ -8,7 +8,11 @@ as BeowulfLine objects in JSON format.
 
 import asyncio
 import json
-from typing import Any, Dict, List
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Callable, Dict, List
 
 from mcp.server import Server
 from mcp.server.lowlevel.helper_types import ReadResourceContents
@@ -24,7 +28,9 @@ from mcp.types import (
 )
 from pydantic import AnyUrl
 
-from beowulf_mcp.cli import fetch_and_store, fetch_store_and_parse
+from beowulf_mcp.cli import DATA_DIR, fetch_and_store, fetch_store_and_parse
+from beowulf_mcp.db import get_db
+from logging_config import get_logger
 from sources import abbreviations, analytical_lexicon, bosworth
 from sources import brunanburh as brunanburh_source
 from sources import brunanburh_normalized as brunanburh_norm_source
@@ -33,6 +39,14 @@ from sources import heorot as heorot_source
 from sources import mcmaster, mit, oldenglishaerobics, perseus
 from sources.heorot import HEOROT_URL, Heorot
 from text.models import BeowulfLine, dict_data_to_beowulf_lines
+from text.numbering import FITT_BOUNDARIES, FITT_OF_LINE
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json gives the same document, just slower
+    orjson = None  # type: ignore[assignment]
+
+logger = get_logger()
 
 # Initialize the MCP server
 server = Server("beowulf-mcp-server")
@@ -82,6 +96,39 @@ _RESOURCE_EDITIONS = {
     "oldenglishaerobics": {"module": oldenglishaerobics, "label": "OE Aerobics"},
 }
 
+# Source modules whose load() has already run in this server session
+_loaded_modules: set[str] = set()
+
+
+def _ensure_loaded(mod: ModuleType) -> None:
+    """Call a source module's load() the first time it is needed, then skip it."""
+    if mod.__name__ not in _loaded_modules:
+        mod.load()
+        _loaded_modules.add(mod.__name__)
+
+
+@lru_cache(maxsize=2048)
+def _lookup(mod: ModuleType, func: str, key: str) -> List[Dict[str, Any]]:
+    """
+    Return mod.func(key), running each distinct lookup once (shared; don't mutate).
+
+    Only for exact-key lookups, which match a handful of rows, so the cache
+    stays small; searches and LIKE patterns can match most of a source and
+    are not cached. Sources don't change while serving, so a key always
+    gives the same rows.
+    """
+    _ensure_loaded(mod)
+    return getattr(mod, func)(key)
+
+
+def _str_arg(tool_args: dict[str, Any], name: str) -> str:
+    """Return a required string tool argument, rejecting other types up front."""
+    value = tool_args[name]
+    if not isinstance(value, str):
+        raise ValueError(f"{name} must be a string, got {type(value).__name__}")
+    return value
+
+
 # Heorot singleton for DuckDB-backed search
 _heorot_db: Heorot | None = None
 
@@ -97,50 +144,96 @@ def _ensure_heorot_db() -> Heorot:
     return _heorot_db
 
 
+# Heorot text as BeowulfLine objects, parsed once per server session
+_beowulf_lines: List[BeowulfLine] | None = None
+
+
+def _get_beowulf_lines() -> List[BeowulfLine]:
+    """Return the Heorot lines as BeowulfLine objects (shared; don't mutate)."""
+    global _beowulf_lines
+    if _beowulf_lines is None:
+        raw_lines = fetch_store_and_parse("maintext", HEOROT_URL)
+        _beowulf_lines = dict_data_to_beowulf_lines(raw_lines)
+    return _beowulf_lines
+
+
+# The same lines as JSON-ready dicts (see beowulf_line_to_dict), built once
+_beowulf_line_dicts: List[Dict[str, Any]] | None = None
+
+
+def _get_beowulf_line_dicts() -> List[Dict[str, Any]]:
+    """Return every Heorot line as a JSON-ready dict (shared; don't mutate)."""
+    global _beowulf_line_dicts
+    if _beowulf_line_dicts is None:
+        _beowulf_line_dicts = [
+            beowulf_line_to_dict(line) for line in _get_beowulf_lines()
+        ]
+    return _beowulf_line_dicts
+
+
+# Their line numbers, ascending as heorot.parse() numbers them, for bisecting
+_beowulf_line_numbers: List[int] | None = None
+
+
+def _get_beowulf_line_numbers() -> List[int]:
+    """Return the line number of each cached Heorot line dict, in the same order."""
+    global _beowulf_line_numbers
+    if _beowulf_line_numbers is None:
+        _beowulf_line_numbers = [
+            line["line_number"] for line in _get_beowulf_line_dicts()
+        ]
+    return _beowulf_line_numbers
+
+
+# Those line dicts grouped by fitt number, built once
+_fitt_line_dicts: Dict[int, List[Dict[str, Any]]] | None = None
+
+
+def _get_fitt_line_dicts() -> Dict[int, List[Dict[str, Any]]]:
+    """Return the Heorot line dicts keyed by fitt number (shared; don't mutate)."""
+    global _fitt_line_dicts
+    if _fitt_line_dicts is None:
+        by_fitt: Dict[int, List[Dict[str, Any]]] = {}
+        for line in _get_beowulf_line_dicts():
+            fitt_id = FITT_OF_LINE.get(line["line_number"])
+            if fitt_id is not None:
+                by_fitt.setdefault(fitt_id, []).append(line)
+        _fitt_line_dicts = by_fitt
+    return _fitt_line_dicts
+
+
 # ─────────────────────────────────────────────────────────────
 # Helpers
 # ─────────────────────────────────────────────────────────────
 
 
-def _handle_edition_resource(uri_str: str) -> List[ReadResourceContents]:
-    """Handle beowulf://text/{edition}[/line/...] resources."""
+def _handle_edition_resource(uri_str: str) -> List[Dict[str, Any]]:
+    """Return the rows for a beowulf://text/{edition}[/line/...] resource."""
     prefix = "beowulf://text/"
-    rest = uri_str[len(prefix) :]
+    key, _, path = uri_str[len(prefix) :].partition("/")
+
+    cfg = _RESOURCE_EDITIONS.get(key)
+    if cfg is None:
+        raise ValueError(f"Unknown edition in URI: {uri_str}")
+    mod = cfg["module"]
+    _ensure_loaded(mod)
+
+    if path == "":
+        return mod.get_lines()
+    if path.startswith("line/"):
+        parts = path[len("line/") :].split("/")
+        if len(parts) == 1:
+            result = mod.get_line(int(parts[0]))
+            return [result] if result else []
+        if len(parts) == 2:
+            return mod.get_lines(int(parts[0]), int(parts[1]))
+        raise ValueError(f"Invalid line URI: {uri_str}")
+    raise ValueError(f"Unknown resource path: {uri_str}")
 
-    for key, cfg in _RESOURCE_EDITIONS.items():
-        if rest == key or rest.startswith(key + "/"):
-            mod = cfg["module"]
-            mod.load()
-            suffix = rest[len(key) :]
-
-            if suffix == "" or suffix == "/":
-                results = mod.get_lines()
-            elif suffix.startswith("/line/"):
-                line_rest = suffix[len("/line/") :]
-                parts = line_rest.split("/")
-                if len(parts) == 1:
-                    result = mod.get_line(int(parts[0]))
-                    results = [result] if result else []
-                elif len(parts) == 2:
-                    results = mod.get_lines(int(parts[0]), int(parts[1]))
-                else:
-                    raise ValueError(f"Invalid line URI: {uri_str}")
-            else:
-                raise ValueError(f"Unknown resource path: {uri_str}")
-
-            return [
-                ReadResourceContents(
-                    content=json.dumps(results, indent=2, ensure_ascii=False),
-                    mime_type="application/json",
-                )
-            ]
-
-    raise ValueError(f"Unknown edition in URI: {uri_str}")
-
-
-def _handle_brunetti_resource(uri_str: str) -> List[ReadResourceContents]:
-    """Handle beowulf://text/brunetti[/...] resources."""
-    brunetti.load()
+
+def _handle_brunetti_resource(uri_str: str) -> List[Dict[str, Any]]:
+    """Return the rows for a beowulf://text/brunetti[/...] resource."""
+    _ensure_loaded(brunetti)
 
     prefix = "beowulf://text/brunetti"
     suffix = uri_str[len(prefix) :]  # "" or "/fitt/1" or "/line/5" or "/line/1/10"
@@ -158,22 +251,14 @@ def _handle_brunetti_resource(uri_str: str) -> List[ReadResourceContents]:
             line_num = parts[0]
             results = brunetti.get_by_line(str(int(line_num)).zfill(4))
         elif len(parts) == 2:
-            start = int(parts[0])
-            end = int(parts[1])
-            results = []
-            for n in range(start, end + 1):
-                results.extend(brunetti.get_by_line(str(n).zfill(4)))
+            # One range query, same rows and order as a get_by_line() per line
+            results = brunetti.get_lines(int(parts[0]), int(parts[1]))
         else:
             raise ValueError(f"Invalid brunetti line URI: {uri_str}")
     else:
         raise ValueError(f"Unknown brunetti resource path: {uri_str}")
 
-    return [
-        ReadResourceContents(
-            content=json.dumps(results, indent=2, ensure_ascii=False),
-            mime_type="application/json",
-        )
-    ]
+    return results
 
 
 def beowulf_line_to_dict(line: BeowulfLine) -> Dict[str, Any]:
@@ -188,13 +273,20 @@ def beowulf_line_to_dict(line: BeowulfLine) -> Dict[str, Any]:
     }
 
 
+def _dumps(data: Any) -> str:
+    """Serialize a payload as 2-space indented JSON, leaving non-ASCII as is."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
 def _json_result(data: Any) -> CallToolResult:
     """Wrap data as a JSON CallToolResult."""
     return CallToolResult(
         content=[
             TextContent(
                 type="text",
-                text=json.dumps(data, indent=2, ensure_ascii=False),
+                text=_dumps(data),
             )
         ]
     )
@@ -271,9 +363,9 @@ def _edition_tools() -> List[Tool]:
     return tools
 
 
-@server.list_tools()
-async def list_tools() -> List:
-    """List available tools."""
+@lru_cache(maxsize=1)
+def _tools() -> List[Tool]:
+    """Build the tool definitions once; they don't change while serving."""
     return [
         # ── Heorot (OE + ME bilingual) ──────────────────────────
         Tool(
@@ -657,14 +749,20 @@ async def list_tools() -> List:
     ]
 
 
+@server.list_tools()
+async def list_tools() -> List:
+    """List available tools."""
+    return _tools()
+
+
 # ─────────────────────────────────────────────────────────────
 # Resources
 # ─────────────────────────────────────────────────────────────
 
 
-@server.list_resources()
-async def list_resources() -> List[Resource]:
-    """List available resources."""
+@lru_cache(maxsize=1)
+def _resources() -> List[Resource]:
+    """Build the resource definitions once; they don't change while serving."""
     resources = [
         Resource(
             uri=f"beowulf://text/{key}",
@@ -685,9 +783,15 @@ async def list_resources() -> List[Resource]:
     return resources
 
 
-@server.list_resource_templates()
-async def list_resource_templates() -> list[ResourceTemplate]:
-    """List available resource templates."""
+@server.list_resources()
+async def list_resources() -> List[Resource]:
+    """List available resources."""
+    return _resources()
+
+
+@lru_cache(maxsize=1)
+def _resource_templates() -> list[ResourceTemplate]:
+    """Build the resource templates once; they don't change while serving."""
     templates: list[ResourceTemplate] = []
     for key, cfg in _RESOURCE_EDITIONS.items():
         label = cfg["label"]
@@ -733,18 +837,57 @@ async def list_resource_templates() -> list[ResourceTemplate]:
     return templates
 
 
+@server.list_resource_templates()
+async def list_resource_templates() -> list[ResourceTemplate]:
+    """List available resource templates."""
+    return _resource_templates()
+
+
+# Encoded JSON of recently read resources, most recent last. Sources are only
+# loaded once per process, so a URI always reads back the same document.
+# Bounded by total size, since a whole-edition document runs to megabytes.
+_RESOURCE_CACHE_CHARS = 32 * 1024 * 1024
+_resource_json: OrderedDict[str, str] = OrderedDict()
+_resource_json_chars = 0
+
+
+def _cache_resource_json(uri_str: str, content: str) -> None:
+    """Keep content for uri_str, evicting the least recently read to fit."""
+    global _resource_json_chars
+    room = _RESOURCE_CACHE_CHARS - len(content)
+    if room < 0:
+        return
+    previous = _resource_json.pop(uri_str, None)
+    if previous is not None:
+        _resource_json_chars -= len(previous)
+    while _resource_json_chars > room:
+        _uri, evicted = _resource_json.popitem(last=False)
+        _resource_json_chars -= len(evicted)
+    _resource_json[uri_str] = content
+    _resource_json_chars += len(content)
+
+
 @server.read_resource()
 async def read_resource(uri: AnyUrl) -> List[ReadResourceContents]:
     """Read a specific resource."""
     uri_str = str(uri)
 
-    if uri_str.startswith("beowulf://text/brunetti"):
-        return _handle_brunetti_resource(uri_str)
+    content = _resource_json.get(uri_str)
+    if content is not None:
+        _resource_json.move_to_end(uri_str)
+        return [ReadResourceContents(content=content, mime_type="application/json")]
 
-    if uri_str.startswith("beowulf://text/"):
-        return _handle_edition_resource(uri_str)
+    if uri_str.startswith("beowulf://text/brunetti"):
+        results = _handle_brunetti_resource(uri_str)
+    elif uri_str.startswith("beowulf://text/"):
+        results = _handle_edition_resource(uri_str)
+    else:
+        raise ValueError(f"Unknown resource: {uri}")
 
-    raise ValueError(f"Unknown resource: {uri}")
+    # Whole-edition reads are megabytes of JSON; encode them off the event loop
+    content = await asyncio.to_thread(_dumps, results)
+    _cache_resource_json(uri_str, content)
+    return [ReadResourceContents(content=content, mime_type="application/json")]
 
 
 # ─────────────────────────────────────────────────────────────
@@ -752,232 +895,342 @@ async def read_resource(uri: AnyUrl) -> List[ReadResourceContents]:
 # ─────────────────────────────────────────────────────────────
 
 
+# Edition tool name -> (edition module, operation), e.g. "mit_search" -> (mit, "search")
+_EDITION_TOOL_DISPATCH: Dict[str, tuple[Any, str]] = {
+    f"{prefix}_{op}": (cfg["module"], op)
+    for prefix, cfg in _TEXT_EDITIONS.items()
+    for op in ("get_line", "get_lines", "search")
+}
+
+
 def _handle_edition_tool(
     tool_name: str, tool_args: dict[str, Any]
 ) -> CallToolResult | None:
     """Handle text edition tools. Returns None if tool_name doesn't match."""
-    for prefix, cfg in _TEXT_EDITIONS.items():
-        mod = cfg["module"]
-        if tool_name == f"{prefix}_get_line":
-            mod.load()
-            line = mod.get_line(tool_args["line_number"])
-            result = {"result": line, "found": line is not None}
-            return _json_result(result)
-        elif tool_name == f"{prefix}_get_lines":
-            mod.load()
-            end = tool_args.get("end")
-            results = mod.get_lines(tool_args["start"], end)
-            return _json_result({"results": results, "count": len(results)})
-        elif tool_name == f"{prefix}_search":
-            mod.load()
-            results = mod.search(tool_args["term"])
-            return _json_result({"results": results, "count": len(results)})
-    return None
+    entry = _EDITION_TOOL_DISPATCH.get(tool_name)
+    if entry is None:
+        return None
+    mod, op = entry
+    _ensure_loaded(mod)
+    if op == "get_line":
+        line = mod.get_line(tool_args["line_number"])
+        result = {"result": line, "found": line is not None}
+        return _json_result(result)
+    if op == "get_lines":
+        end = tool_args.get("end")
+        results = mod.get_lines(tool_args["start"], end)
+        return _json_result({"results": results, "count": len(results)})
+    results = mod.search(tool_args["term"])
+    return _json_result({"results": results, "count": len(results)})
 
 
-@server.call_tool()
-async def call_tool(tool_name: str, tool_args: dict[str, Any]) -> CallToolResult:
-    """Handle tool calls."""
-    if tool_name == "get_beowulf_lines":
-        raw_lines = fetch_store_and_parse("maintext", HEOROT_URL)
-        beowulf_lines = dict_data_to_beowulf_lines(raw_lines)
-
-        # Apply optional line range filter
-        line_from = tool_args.get("from")
-        line_to = tool_args.get("to")
-        if line_from is not None or line_to is not None:
-            start = line_from if line_from is not None else 0
-            end = line_to if line_to is not None else 3182
-            beowulf_lines = [
-                line for line in beowulf_lines if start <= line.line_number <= end
-            ]
-
-        result = {
-            "lines": [beowulf_line_to_dict(line) for line in beowulf_lines],
-            "count": len(beowulf_lines),
-        }
-        return _json_result(result)
+# ─────────────────────────────────────────────────────────────
+# Tool handlers
+# ─────────────────────────────────────────────────────────────
 
-    elif tool_name == "get_beowulf_summary":
-        raw_lines = fetch_store_and_parse("maintext", HEOROT_URL)
-        beowulf_lines = dict_data_to_beowulf_lines(raw_lines)
-
-        title_lines = [line for line in beowulf_lines if line.is_title_line]
-        result = {
-            "total_lines": len(beowulf_lines),
-            "title_lines": len(title_lines),
-            "empty_lines": len([line for line in beowulf_lines if line.is_empty]),
-            "sample_lines": [
-                beowulf_line_to_dict(beowulf_lines[0]),
-                beowulf_line_to_dict(beowulf_lines[1]),
-                beowulf_line_to_dict(beowulf_lines[-1]),
-            ],
-        }
-        return _json_result(result)
 
-    elif tool_name == "get_fitt_lines":
-        fitt_number = tool_args["fitt_number"]
+def _tool_get_beowulf_lines(tool_args: dict[str, Any]) -> CallToolResult:
+    line_dicts = _get_beowulf_line_dicts()
 
-        if fitt_number == 24:
-            raise ValueError("Fitt 24 does not exist in Beowulf")
+    # Apply optional line range filter
+    line_from = tool_args.get("from")
+    line_to = tool_args.get("to")
+    if line_from is not None or line_to is not None:
+        start = line_from if line_from is not None else 0
+        end = line_to if line_to is not None else 3182
+        numbers = _get_beowulf_line_numbers()
+        line_dicts = line_dicts[
+            bisect_left(numbers, start) : bisect_right(numbers, end)
+        ]
 
-        # Get all lines and filter for the fitt
-        raw_lines = fetch_store_and_parse("maintext", HEOROT_URL)
-        beowulf_lines = dict_data_to_beowulf_lines(raw_lines)
+    result = {"lines": line_dicts, "count": len(line_dicts)}
+    return _json_result(result)
 
-        from text.numbering import FITT_BOUNDARIES
 
-        start_line = FITT_BOUNDARIES[fitt_number][0]
-        end_line = FITT_BOUNDARIES[fitt_number][1]
-        fitt_name = FITT_BOUNDARIES[fitt_number][2]
+def _tool_get_beowulf_summary(tool_args: dict[str, Any]) -> CallToolResult:
+    beowulf_lines = _get_beowulf_lines()
 
-        fitt_lines = [
-            line for line in beowulf_lines if start_line <= line.line_number <= end_line
-        ]
+    result = {
+        "total_lines": len(beowulf_lines),
+        "title_lines": sum(1 for line in beowulf_lines if line.is_title_line),
+        "empty_lines": sum(1 for line in beowulf_lines if line.is_empty),
+        "sample_lines": [
+            beowulf_line_to_dict(beowulf_lines[0]),
+            beowulf_line_to_dict(beowulf_lines[1]),
+            beowulf_line_to_dict(beowulf_lines[-1]),
+        ],
+    }
+    return _json_result(result)
 
-        result = {
-            "fitt_number": fitt_number,
-            "fitt_name": fitt_name,
-            "start_line": start_line,
-            "end_line": end_line,
-            "lines": [beowulf_line_to_dict(line) for line in fitt_lines],
-            "count": len(fitt_lines),
-        }
-        return _json_result(result)
 
-    elif tool_name == "heorot_search":
-        heorot = _ensure_heorot_db()
-        term = tool_args["term"]
-        language = tool_args.get("language")
-        if language == "oe":
-            results = heorot.search_oe(term)
-        elif language == "me":
-            results = heorot.search_me(term)
-        else:
-            results = heorot.search(term)
-        return _json_result({"results": results, "count": len(results)})
+def _tool_get_fitt_lines(tool_args: dict[str, Any]) -> CallToolResult:
+    fitt_number = tool_args["fitt_number"]
 
-    # ── Bosworth-Toller ─────────────────────────────────────
-    elif tool_name == "bt_lookup":
-        bosworth.load()
-        results = bosworth.lookup(tool_args["word"])
-        return _json_result({"results": results, "count": len(results)})
+    if fitt_number == 24:
+        raise ValueError("Fitt 24 does not exist in Beowulf")
 
-    elif tool_name == "bt_lookup_like":
-        bosworth.load()
-        results = bosworth.lookup_like(tool_args["pattern"])
-        return _json_result({"results": results, "count": len(results)})
+    start_line, end_line, fitt_name = FITT_BOUNDARIES[fitt_number]
+    fitt_lines = _get_fitt_line_dicts().get(fitt_number, [])
 
-    elif tool_name == "bt_search":
-        bosworth.load()
-        column = tool_args.get("column")
-        results = bosworth.search(tool_args["term"], column=column)
-        return _json_result({"results": results, "count": len(results)})
+    result = {
+        "fitt_number": fitt_number,
+        "fitt_name": fitt_name,
+        "start_line": start_line,
+        "end_line": end_line,
+        "lines": fitt_lines,
+        "count": len(fitt_lines),
+    }
+    return _json_result(result)
 
-    elif tool_name == "bt_abbreviation":
-        abbreviations.load()
-        results = abbreviations.lookup(tool_args["abbrev"])
-        return _json_result({"results": results, "count": len(results)})
 
-    # ── Brunetti ────────────────────────────────────────────
-    elif tool_name == "brunetti_lookup":
-        brunetti.load()
-        results = brunetti.lookup(tool_args["lemma"])
-        return _json_result({"results": results, "count": len(results)})
+def _tool_heorot_search(tool_args: dict[str, Any]) -> CallToolResult:
+    heorot = _ensure_heorot_db()
+    term = tool_args["term"]
+    language = tool_args.get("language")
+    if language == "oe":
+        results = heorot.search_oe(term)
+    elif language == "me":
+        results = heorot.search_me(term)
+    else:
+        results = heorot.search(term)
+    return _json_result({"results": results, "count": len(results)})
 
-    elif tool_name == "brunetti_lookup_like":
-        brunetti.load()
-        results = brunetti.lookup_like(tool_args["pattern"])
-        return _json_result({"results": results, "count": len(results)})
 
-    elif tool_name == "brunetti_search":
-        brunetti.load()
-        column = tool_args.get("column")
-        results = brunetti.search(tool_args["term"], column=column)
-        return _json_result({"results": results, "count": len(results)})
+# ── Bosworth-Toller ─────────────────────────────────────────
 
-    elif tool_name == "brunetti_get_by_line":
-        brunetti.load()
-        results = brunetti.get_by_line(tool_args["line_id"])
-        return _json_result({"results": results, "count": len(results)})
 
-    elif tool_name == "brunetti_get_by_fitt":
-        brunetti.load()
-        results = brunetti.get_by_fitt(tool_args["fitt_id"])
-        return _json_result({"results": results, "count": len(results)})
+def _tool_bt_lookup(tool_args: dict[str, Any]) -> CallToolResult:
+    results = _lookup(bosworth, "lookup", _str_arg(tool_args, "word"))
+    return _json_result({"results": results, "count": len(results)})
 
-    # ── Analytical Lexicon ──────────────────────────────────
-    elif tool_name == "lexicon_lookup":
-        analytical_lexicon.load()
-        results = analytical_lexicon.lookup(tool_args["headword"])
-        return _json_result({"results": results, "count": len(results)})
 
-    elif tool_name == "lexicon_lookup_like":
-        analytical_lexicon.load()
-        results = analytical_lexicon.lookup_like(tool_args["pattern"])
-        return _json_result({"results": results, "count": len(results)})
+def _tool_bt_lookup_like(tool_args: dict[str, Any]) -> CallToolResult:
+    _ensure_loaded(bosworth)
+    results = bosworth.lookup_like(tool_args["pattern"])
+    return _json_result({"results": results, "count": len(results)})
 
-    elif tool_name == "lexicon_search":
-        analytical_lexicon.load()
-        column = tool_args.get("column")
-        results = analytical_lexicon.search(tool_args["term"], column=column)
-        return _json_result({"results": results, "count": len(results)})
 
-    # ── Brunanburh (sacred-texts) ──────────────────────────
-    elif tool_name == "brunanburh_get_line":
-        brunanburh_source.load()
-        line = brunanburh_source.get_line(tool_args["line_number"])
-        return _json_result({"result": line, "found": line is not None})
+def _tool_bt_search(tool_args: dict[str, Any]) -> CallToolResult:
+    _ensure_loaded(bosworth)
+    column = tool_args.get("column")
+    results = bosworth.search(tool_args["term"], column=column)
+    return _json_result({"results": results, "count": len(results)})
 
-    elif tool_name == "brunanburh_get_lines":
-        brunanburh_source.load()
-        end = tool_args.get("end")
-        results = brunanburh_source.get_lines(tool_args["start"], end)
-        return _json_result({"results": results, "count": len(results)})
 
-    elif tool_name == "brunanburh_search":
-        brunanburh_source.load()
-        results = brunanburh_source.search(tool_args["term"])
-        return _json_result({"results": results, "count": len(results)})
+def _tool_bt_abbreviation(tool_args: dict[str, Any]) -> CallToolResult:
+    results = _lookup(abbreviations, "lookup", _str_arg(tool_args, "abbrev"))
+    return _json_result({"results": results, "count": len(results)})
 
-    # ── Brunanburh Normalized (CLASP) ────────────────────
-    elif tool_name == "brunanburh_normalized_get_line":
-        brunanburh_norm_source.load()
-        line = brunanburh_norm_source.get_line(tool_args["line_number"])
-        return _json_result({"result": line, "found": line is not None})
 
-    elif tool_name == "brunanburh_normalized_get_lines":
-        brunanburh_norm_source.load()
-        end = tool_args.get("end")
-        results = brunanburh_norm_source.get_lines(tool_args["start"], end)
-        return _json_result({"results": results, "count": len(results)})
+# ── Brunetti ────────────────────────────────────────────────
+
+
+def _tool_brunetti_lookup(tool_args: dict[str, Any]) -> CallToolResult:
+    results = _lookup(brunetti, "lookup", _str_arg(tool_args, "lemma"))
+    return _json_result({"results": results, "count": len(results)})
+
+
+def _tool_brunetti_lookup_like(tool_args: dict[str, Any]) -> CallToolResult:
+    _ensure_loaded(brunetti)
+    results = brunetti.lookup_like(tool_args["pattern"])
+    return _json_result({"results": results, "count": len(results)})
 
-    elif tool_name == "brunanburh_normalized_search":
-        brunanburh_norm_source.load()
-        column = tool_args.get("column")
-        if column == "oe":
-            results = brunanburh_norm_source.get_brunanburh_normalized().search_oe(
-                tool_args["term"]
-            )
-        elif column == "normed":
-            results = brunanburh_norm_source.get_brunanburh_normalized().search_normed(
-                tool_args["term"]
-            )
-        else:
-            results = brunanburh_norm_source.search(tool_args["term"])
-        return _json_result({"results": results, "count": len(results)})
 
+def _tool_brunetti_search(tool_args: dict[str, Any]) -> CallToolResult:
+    _ensure_loaded(brunetti)
+    column = tool_args.get("column")
+    results = brunetti.search(tool_args["term"], column=column)
+    return _json_result({"results": results, "count": len(results)})
+
+
+def _tool_brunetti_get_by_line(tool_args: dict[str, Any]) -> CallToolResult:
+    results = _lookup(brunetti, "get_by_line", _str_arg(tool_args, "line_id"))
+    return _json_result({"results": results, "count": len(results)})
+
+
+def _tool_brunetti_get_by_fitt(tool_args: dict[str, Any]) -> CallToolResult:
+    results = _lookup(brunetti, "get_by_fitt", _str_arg(tool_args, "fitt_id"))
+    return _json_result({"results": results, "count": len(results)})
+
+
+# ── Analytical Lexicon ──────────────────────────────────────
+
+
+def _tool_lexicon_lookup(tool_args: dict[str, Any]) -> CallToolResult:
+    results = _lookup(analytical_lexicon, "lookup", _str_arg(tool_args, "headword"))
+    return _json_result({"results": results, "count": len(results)})
+
+
+def _tool_lexicon_lookup_like(tool_args: dict[str, Any]) -> CallToolResult:
+    _ensure_loaded(analytical_lexicon)
+    results = analytical_lexicon.lookup_like(tool_args["pattern"])
+    return _json_result({"results": results, "count": len(results)})
+
+
+def _tool_lexicon_search(tool_args: dict[str, Any]) -> CallToolResult:
+    _ensure_loaded(analytical_lexicon)
+    column = tool_args.get("column")
+    results = analytical_lexicon.search(tool_args["term"], column=column)
+    return _json_result({"results": results, "count": len(results)})
+
+
+# ── Brunanburh (sacred-texts) ───────────────────────────────
+
+
+def _tool_brunanburh_get_line(tool_args: dict[str, Any]) -> CallToolResult:
+    _ensure_loaded(brunanburh_source)
+    line = brunanburh_source.get_line(tool_args["line_number"])
+    return _json_result({"result": line, "found": line is not None})
+
+
+def _tool_brunanburh_get_lines(tool_args: dict[str, Any]) -> CallToolResult:
+    _ensure_loaded(brunanburh_source)
+    end = tool_args.get("end")
+    results = brunanburh_source.get_lines(tool_args["start"], end)
+    return _json_result({"results": results, "count": len(results)})
+
+
+def _tool_brunanburh_search(tool_args: dict[str, Any]) -> CallToolResult:
+    _ensure_loaded(brunanburh_source)
+    results = brunanburh_source.search(tool_args["term"])
+    return _json_result({"results": results, "count": len(results)})
+
+
+# ── Brunanburh Normalized (CLASP) ───────────────────────────
+
+
+def _tool_brunanburh_normalized_get_line(tool_args: dict[str, Any]) -> CallToolResult:
+    _ensure_loaded(brunanburh_norm_source)
+    line = brunanburh_norm_source.get_line(tool_args["line_number"])
+    return _json_result({"result": line, "found": line is not None})
+
+
+def _tool_brunanburh_normalized_get_lines(
+    tool_args: dict[str, Any],
+) -> CallToolResult:
+    _ensure_loaded(brunanburh_norm_source)
+    end = tool_args.get("end")
+    results = brunanburh_norm_source.get_lines(tool_args["start"], end)
+    return _json_result({"results": results, "count": len(results)})
+
+
+def _tool_brunanburh_normalized_search(tool_args: dict[str, Any]) -> CallToolResult:
+    _ensure_loaded(brunanburh_norm_source)
+    column = tool_args.get("column")
+    if column == "oe":
+        results = brunanburh_norm_source.get_brunanburh_normalized().search_oe(
+            tool_args["term"]
+        )
+    elif column == "normed":
+        results = brunanburh_norm_source.get_brunanburh_normalized().search_normed(
+            tool_args["term"]
+        )
     else:
-        # Try text edition tools
-        edition_result = _handle_edition_tool(tool_name, tool_args)
-        if edition_result is not None:
-            return edition_result
+        results = brunanburh_norm_source.search(tool_args["term"])
+    return _json_result({"results": results, "count": len(results)})
+
+
+# Tool name -> handler; text edition tools go through _EDITION_TOOL_DISPATCH
+_TOOL_HANDLERS: Dict[str, Callable[[dict[str, Any]], CallToolResult]] = {
+    "get_beowulf_lines": _tool_get_beowulf_lines,
+    "get_beowulf_summary": _tool_get_beowulf_summary,
+    "get_fitt_lines": _tool_get_fitt_lines,
+    "heorot_search": _tool_heorot_search,
+    "bt_lookup": _tool_bt_lookup,
+    "bt_lookup_like": _tool_bt_lookup_like,
+    "bt_search": _tool_bt_search,
+    "bt_abbreviation": _tool_bt_abbreviation,
+    "brunetti_lookup": _tool_brunetti_lookup,
+    "brunetti_lookup_like": _tool_brunetti_lookup_like,
+    "brunetti_search": _tool_brunetti_search,
+    "brunetti_get_by_line": _tool_brunetti_get_by_line,
+    "brunetti_get_by_fitt": _tool_brunetti_get_by_fitt,
+    "lexicon_lookup": _tool_lexicon_lookup,
+    "lexicon_lookup_like": _tool_lexicon_lookup_like,
+    "lexicon_search": _tool_lexicon_search,
+    "brunanburh_get_line": _tool_brunanburh_get_line,
+    "brunanburh_get_lines": _tool_brunanburh_get_lines,
+    "brunanburh_search": _tool_brunanburh_search,
+    "brunanburh_normalized_get_line": _tool_brunanburh_normalized_get_line,
+    "brunanburh_normalized_get_lines": _tool_brunanburh_normalized_get_lines,
+    "brunanburh_normalized_search": _tool_brunanburh_normalized_search,
+}
+
 
-        raise ValueError(f"Unknown tool: {tool_name}")
+@server.call_tool()
+async def call_tool(tool_name: str, tool_args: dict[str, Any]) -> CallToolResult:
+    """Handle tool calls."""
+    handler = _TOOL_HANDLERS.get(tool_name)
+    if handler is not None:
+        return handler(tool_args)
+
+    # Try text edition tools
+    edition_result = _handle_edition_tool(tool_name, tool_args)
+    if edition_result is not None:
+        return edition_result
+
+    raise ValueError(f"Unknown tool: {tool_name}")
+
+
+def _prewarm() -> None:
+    """
+    Load the Heorot table and parsed lines before serving, if already stored.
+
+    The table is opened only if it is in the database, and the lines are read
+    only if the page and its parsed lines are on disk. On a cold start that
+    would mean fetching and parsing heorot.dk before answering initialize,
+    so it is left to the first Heorot request instead. Best effort: a failed
+    load is tried again on first use, as it would be without prewarming.
+    """
+    try:
+        if get_db().table_exists(heorot_source.TABLE_NAME):
+            _ensure_heorot_db()
+        if all(
+            (DATA_DIR / name).exists()
+            for name in ("maintext.html", "maintext.lines.json")
+        ):
+            _get_beowulf_lines()
+    except Exception as e:
+        logger.warning("Heorot prewarm failed, loading on first use", error=str(e))
+
+
+# Sources loaded from bundled assets. Only those whose table is already in the
+# database are warmed at startup; a cold load (seconds for some) is left to the
+# first request that needs it rather than holding up initialize.
+_PREWARM_SOURCES: tuple[ModuleType, ...] = (
+    bosworth,
+    abbreviations,
+    analytical_lexicon,
+    *(cfg["module"] for cfg in _TEXT_EDITIONS.values()),
+    brunanburh_source,
+    brunanburh_norm_source,
+)
+
+
+def _prewarm_sources() -> None:
+    """
+    Mark the asset-backed sources whose tables already exist as loaded.
+
+    For an existing table load() only checks and counts it, so this costs
+    milliseconds. Best effort: a source that fails loads again on first use.
+    """
+    db = get_db()
+    for mod in _PREWARM_SOURCES:
+        try:
+            if db.table_exists(mod.TABLE_NAME):
+                _ensure_loaded(mod)
+        except Exception as e:
+            logger.warning(
+                "Source prewarm failed, loading on first use",
+                source=mod.__name__,
+                error=str(e),
+            )
 
 
 async def main():
     """Run the MCP server."""
+    _prewarm()
+    _prewarm_sources()
     async with stdio_server() as (read_stream, write_stream):
         await server.run(
             read_stream,
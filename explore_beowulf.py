@@ -15,43 +15,36 @@ Findings are captured as assertions in tests/test_explore_findings.py.
 """
 
 from collections import Counter, defaultdict
+from operator import itemgetter
 from typing import Dict, List, Tuple
 
 _brunetti_cache: List[dict] = []
 
 
 def parse_brunetti_file() -> List[dict]:
-    """Parse Brunetti data by fetching from the Brunetti online URL.
+    """Parse Brunetti data fetched from the Brunetti online URL.
 
     Uses the Brunetti parser directly (no DuckDB). Surface text is
     reconstructed from oe_line via extract_brunetti_surface(). Fitt IDs
-    are assigned from FITT_BOUNDARIES (which skips fitt 24).
+    are assigned from FITT_OF_LINE (which skips fitt 24).
 
-    Results are cached at module level so multiple fixtures share one fetch.
+    The page is stored under output/ on first fetch, so later runs parse the
+    local copy instead of going back to the network. Results are also cached
+    at module level so multiple fixtures share one parse.
     """
     global _brunetti_cache
     if _brunetti_cache:
         return _brunetti_cache
 
-    import requests
-
+    from beowulf_mcp.cli import fetch_and_store
     from sources.align_sources import extract_brunetti_surface
     from sources.brunetti import BRUNETTI_ONLINE_URL
     from sources.brunetti import parse as parse_brunetti_html
-    from text.numbering import FITT_BOUNDARIES
-
-    # Build line → fitt index lookup
-    fitt_lookup: Dict[int, str] = {}
-    for i, (start, end, _) in enumerate(FITT_BOUNDARIES):
-        if start == 0 and end == 0:
-            continue  # skip placeholder (fitt 24)
-        for line_num in range(start, end + 1):
-            fitt_lookup[line_num] = str(i)
+    from text.numbering import FITT_OF_LINE
 
-    response = requests.get(BRUNETTI_ONLINE_URL, timeout=60)
-    response.encoding = "utf-8"
-    response.raise_for_status()
-    all_rows = parse_brunetti_html(response.text)
+    # Decoded as UTF-8 whatever the server declares, as sources.brunetti does
+    html = fetch_and_store(BRUNETTI_ONLINE_URL, "brunetti.html", encoding="utf-8")
+    all_rows = parse_brunetti_html(html)
 
     tokens = []
     for row in all_rows:
@@ -59,7 +52,8 @@ def parse_brunetti_file() -> List[dict]:
         half_line = row["half_line"]
         token_offset = row["token_offset"]
         text = extract_brunetti_surface(row["oe_line"], half_line, token_offset)
-        fitt_id = fitt_lookup.get(int(line_id))
+        fitt = FITT_OF_LINE.get(int(line_id))
+        fitt_id = str(fitt) if fitt is not None else None
 
         tokens.append(
             {
@@ -85,21 +79,17 @@ def parse_aligned_file() -> List[dict]:
     from pathlib import Path
 
     editions = ["mit", "mcmaster", "heorot", "ebeowulf", "perseus", "brunetti"]
+    # Each line is six ids then six texts; rows pair them up per edition
+    keys = [key for ed in editions for key in (f"{ed}_id", f"{ed}_text")]
+    pick = itemgetter(*(j for i in range(len(editions)) for j in (i, i + 6)))
     rows = []
     path = Path("output") / "aligned-sources.txt"
     with open(path) as f:
         for line in f:
-            line = line.rstrip("\n")
-            if not line:
-                continue
-            parts = line.split(" ")
+            parts = line.rstrip("\n").split(" ")
             if len(parts) != 12:
                 continue
-            row = {}
-            for i, ed in enumerate(editions):
-                row[f"{ed}_id"] = parts[i]
-                row[f"{ed}_text"] = parts[i + 6]
-            rows.append(row)
+            rows.append(dict(zip(keys, pick(parts))))
     return rows
 
 
@@ -121,21 +111,16 @@ def analyze_scribal_hands(tokens: List[dict]) -> dict:
     io_lines = []  # Lines where the text uses "io" (Scribe B preference)
 
     for t in beowulf_tokens:
-        line_num = int(t["line_id"])
-        surface = t["text"] or ""
-        if "io" in surface.lower():
-            io_lines.append(line_num)
-        elif "eo" in surface.lower():
-            eo_lines.append(line_num)
+        surface = (t["text"] or "").lower()
+        if "io" in surface:
+            io_lines.append(int(t["line_id"]))
+        elif "eo" in surface:
+            eo_lines.append(int(t["line_id"]))
 
     # Find the transition zone
     last_eo = max(eo_lines) if eo_lines else 0
     first_io = min(io_lines) if io_lines else 9999
 
-    # There may be overlap — find the cleanest boundary
-    # Where does Scribe B start consistently using "io"?
-    transition_candidates = sorted(set(eo_lines + io_lines))
-
     return {
         "eo_count": len(eo_lines),
         "io_count": len(io_lines),
@@ -159,32 +144,22 @@ def analyze_scribal_hands(tokens: List[dict]) -> dict:
 
 def find_hapax_legomena(tokens: List[dict]) -> List[dict]:
     """Find lemmas that appear exactly once in the entire poem."""
-    lemma_counts: Counter = Counter()
-    lemma_to_token: Dict[str, dict] = {}
-
-    for t in tokens:
-        lemma = t["lemma"]
-        if not lemma:
-            continue
-        lemma_counts[lemma] += 1
-        if lemma not in lemma_to_token:
-            lemma_to_token[lemma] = t
-
-    hapaxes = []
-    for lemma, count in lemma_counts.items():
-        if count == 1:
-            tok = lemma_to_token[lemma]
-            hapaxes.append(
-                {
-                    "lemma": lemma,
-                    "text": tok["text"],
-                    "with_length": tok["with_length"],
-                    "gloss": tok["gloss"],
-                    "pos": tok["pos"],
-                    "line_id": tok["line_id"],
-                    "fitt_id": tok["fitt_id"],
-                }
-            )
+    lemma_counts = Counter(t["lemma"] for t in tokens if t["lemma"])
+
+    # A lemma seen once has exactly one token, so no first-occurrence map is needed
+    hapaxes = [
+        {
+            "lemma": t["lemma"],
+            "text": t["text"],
+            "with_length": t["with_length"],
+            "gloss": t["gloss"],
+            "pos": t["pos"],
+            "line_id": t["line_id"],
+            "fitt_id": t["fitt_id"],
+        }
+        for t in tokens
+        if t["lemma"] and lemma_counts[t["lemma"]] == 1
+    ]
 
     return sorted(hapaxes, key=lambda h: int(h["line_id"]))
 
@@ -249,21 +224,31 @@ def pos_distribution(tokens: List[dict]) -> List[Tuple[str, str, int, float]]:
 # ═══════════════════════════════════════════════════════════════
 
 
+# One pass that drops common OE punctuation variations and folds some common
+# spelling alternations, for rough comparison of readings
+_NORMALIZE_TABLE = str.maketrans(
+    {
+        **dict.fromkeys(".,;:!'·[](){}\"–—"),
+        "ð": "th",
+        "þ": "th",
+        "æ": "ae",
+        "ǣ": "ae",
+        "ā": "a",
+        "ē": "e",
+        "ī": "i",
+        "ō": "o",
+        "ū": "u",
+        "ȳ": "y",
+    }
+)
+
+
 def edition_disagreements(aligned: List[dict]) -> dict:
     """Find rows where editions have genuinely different root words."""
-    import re
 
     def normalize(text: str) -> str:
         """Strip punctuation and diacritics-ish chars for rough comparison."""
-        text = text.lower()
-        # Remove common OE punctuation variations
-        text = re.sub(r"[.,;:!'·\[\](){}\"–—]", "", text)
-        # Normalize some common spelling alternations
-        text = text.replace("ð", "th").replace("þ", "th")
-        text = text.replace("æ", "ae").replace("ǣ", "ae").replace("ā", "a")
-        text = text.replace("ē", "e").replace("ī", "i").replace("ō", "o")
-        text = text.replace("ū", "u").replace("ȳ", "y")
-        return text.strip("_")
+        return text.lower().translate(_NORMALIZE_TABLE).strip("_")
 
     editions = ["mit", "mcmaster", "heorot", "ebeowulf", "perseus", "brunetti"]
     divergent_rows = []
@@ -8,10 +8,20 @@ import structlog
 LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
 logging.basicConfig(level=LOG_LEVEL)
 
+# The pretty console renderer is for interactive debugging; otherwise emit
+# plain JSON, which is much cheaper to format per record
+_renderer = (
+    structlog.dev.ConsoleRenderer(pad_event_to=25)
+    if LOG_LEVEL == "DEBUG"
+    else structlog.processors.JSONRenderer()
+)
+
 structlog.configure(
     processors=[
+        # Drop records below LOG_LEVEL before any timestamping or rendering
+        structlog.stdlib.filter_by_level,
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.dev.ConsoleRenderer(pad_event_to=25),
+        _renderer,
     ],
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
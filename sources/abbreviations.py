@@ -1,11 +1,12 @@
 """Bosworth-Toller abbreviations interface backed by DuckDB."""
 
 import re
-import xml.etree.ElementTree as ET
 from typing import List, Optional
 
+from lxml import etree
+
 from assets import get_asset_path
-from beowulf_mcp.db import BeoDB
+from beowulf_mcp.db import BeoDB, get_db
 from logging_config import get_logger
 
 logger = get_logger()
@@ -16,6 +17,14 @@ BT_ABBREVIATIONS_XML = "bt_abbreviations.xml"
 # Table name for this source
 TABLE_NAME = "abbreviations"
 
+# Runs of whitespace collapsed to a single space in descriptions
+_WS_RE = re.compile(r"\s+")
+
+# Compiled XPaths for the text of a <source>'s spellout, heading and body
+_SPELLOUT_XP = etree.XPath("string(spellout)")
+_HEADING_XP = etree.XPath("string(heading)")
+_BODY_XP = etree.XPath("string(body)")
+
 
 class Abbreviations:
     """Interface to the Bosworth-Toller abbreviations."""
@@ -55,41 +64,43 @@ class Abbreviations:
         xml_path = get_asset_path(BT_ABBREVIATIONS_XML)
         logger.info("Loading abbreviations from XML", xml_path=str(xml_path))
 
-        # Parse the XML
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
-
-        # Create the table
-        self._db.conn.execute(
-            f"""
-            CREATE TABLE {TABLE_NAME} (
-                abbreviation VARCHAR,
-                expansion VARCHAR,
-                description VARCHAR
-            )
-        """
-        )
-
-        # Extract and insert abbreviations
-        for source in root.findall("source"):
-            spellout = source.find("spellout")
-            heading = source.find("heading")
-            body = source.find("body")
-
-            abbrev = (
-                spellout.text.strip() if spellout is not None and spellout.text else ""
-            )
-            expansion = (
-                heading.text.strip() if heading is not None and heading.text else ""
-            )
-            desc = body.text.strip() if body is not None and body.text else ""
-
+        # Stream the XML one <source> at a time instead of building the whole tree,
+        # collecting one list per column for a single insert below
+        abbrevs: List[str] = []
+        expansions: List[str] = []
+        descs: List[str] = []
+        for _, source in etree.iterparse(str(xml_path), events=("end",), tag="source"):
+            # string() gives "" for a missing element, like the old None checks
+            abbrev = _SPELLOUT_XP(source).strip()
+            expansion = _HEADING_XP(source).strip()
             # Clean up whitespace in description
-            desc = re.sub(r"\s+", " ", desc)
-
-            self._db.conn.execute(
-                f"INSERT INTO {TABLE_NAME} VALUES (?, ?, ?)",
-                [abbrev, expansion, desc],
+            desc = _WS_RE.sub(" ", _BODY_XP(source).strip())
+
+            abbrevs.append(abbrev)
+            expansions.append(expansion)
+            descs.append(desc)
+
+            # Free the processed element and any already-handled siblings
+            source.clear()
+            while source.getprevious() is not None:
+                del source.getparent()[0]
+
+        # Create the table and insert all abbreviations in one batch, committed once
+        with self._db.transaction() as conn:
+            conn.execute(
+                f"""
+                CREATE TABLE {TABLE_NAME} (
+                    abbreviation VARCHAR,
+                    expansion VARCHAR,
+                    description VARCHAR
+                )
+            """
+            )
+            # Bind whole columns as lists and unnest them side by side: one
+            # vectorized INSERT instead of executemany's statement per row
+            conn.execute(
+                f"INSERT INTO {TABLE_NAME} SELECT unnest(?), unnest(?), unnest(?)",
+                [abbrevs, expansions, descs],
             )
 
         row_count = self._db.count(TABLE_NAME)
@@ -107,13 +118,9 @@ class Abbreviations:
         Returns:
             List of matching abbreviation entries.
         """
-        result = self._db.conn.execute(
+        return self._db.fetch_dicts(
             f"SELECT * FROM {TABLE_NAME} WHERE abbreviation LIKE ?", [f"%{abbrev}%"]
-        ).fetchall()
-        return [
-            {"abbreviation": row[0], "expansion": row[1], "description": row[2]}
-            for row in result
-        ]
+        )
 
 
 # Module-level convenience functions
@@ -121,10 +128,10 @@ _default_abbr_instance: Optional[Abbreviations] = None
 
 
 def get_abbreviations() -> Abbreviations:
-    """Get the default Abbreviations instance."""
+    """Get the default Abbreviations instance, on the shared get_db() connection."""
     global _default_abbr_instance
     if _default_abbr_instance is None:
-        _default_abbr_instance = Abbreviations()
+        _default_abbr_instance = Abbreviations(db=get_db())
     return _default_abbr_instance
 
 
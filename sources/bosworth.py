@@ -1,9 +1,11 @@
 """Bosworth-Toller Old English Dictionary interface backed by DuckDB."""
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+import duckdb
 
 from assets import get_asset_path
-from beowulf_mcp.db import BeoDB, _quote_identifier
+from beowulf_mcp.db import BeoDB, _quote_identifier, get_db
 from logging_config import get_logger
 
 logger = get_logger()
@@ -14,25 +16,86 @@ BT_CSV_ASSET = "oe_bt.csv"
 # Table name for this source
 TABLE_NAME = "bosworth"
 
+# Index on the headword column, used by exact-match lookups
+HEADWORD_INDEX = "idx_bosworth_headword"
+
+# Lowercased copies stored at load time so search() doesn't case-fold per query.
+# They are internal to search() and left out of returned entries.
+LOWERCASE_COLUMNS = {
+    "headword": "headword_lc",
+    "cleaned_definition": "cleaned_definition_lc",
+}
+_LOWERCASE_LIST = ", ".join(LOWERCASE_COLUMNS.values())
+_ENTRY_COLUMNS = f"* EXCLUDE ({_LOWERCASE_LIST})"
+
+# Schema DuckDB's fts extension creates for the bosworth full-text index
+FTS_SCHEMA = f"fts_main_{TABLE_NAME}"
+
+# Set once the fts extension fails to install, so offline runs don't retry it
+_fts_unavailable = False
+
 
 class BosworthToller:
     """Interface to the Bosworth-Toller Old English Dictionary."""
 
-    def __init__(self, db: Optional[BeoDB] = None) -> None:
+    def __init__(self, db: Optional[BeoDB] = None, fts: bool = False) -> None:
         """
         Initialize the dictionary interface.
 
         Args:
             db: BeoDB instance. Defaults to BeoDB() using the configured DB_PATH.
+            fts: If True, load() builds a full-text index (installing DuckDB's
+                fts extension if needed) and all-column search() ranks by BM25.
+                By default search() is a substring match on every machine.
         """
         self._db = db or BeoDB()
+        self._use_fts = fts
+        self._columns: Optional[List[str]] = None
+        self._schema: Optional[dict[str, str]] = None
+        self._search_where: Optional[dict[Optional[str], Tuple[str, int]]] = None
+        self._fts: Optional[bool] = None
 
     def __enter__(self) -> "BosworthToller":
         return self
 
     def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        self._clear_schema_cache()
         self._db.close()
 
+    def _clear_schema_cache(self) -> None:
+        """Forget cached column names and schema (after a reload or close)."""
+        self._columns = None
+        self._schema = None
+        self._search_where = None
+        self._fts = None
+
+    def get_columns(self) -> List[str]:
+        """
+        Get the column names of dictionary entries in the bosworth table.
+
+        The lowercased search columns are left out. The result is cached once
+        the table exists, since the columns never change between loads.
+
+        Returns:
+            Column names in table order, or an empty list if not loaded.
+        """
+        if self._columns is None:
+            columns = self._db.get_columns(TABLE_NAME)
+            if not columns:
+                return []
+            lowercase = LOWERCASE_COLUMNS.values()
+            self._columns = [col for col in columns if col not in lowercase]
+        return self._columns
+
+    def get_schema(self) -> dict[str, str]:
+        """Get the bosworth table schema as {column_name: data_type}, cached."""
+        if self._schema is None:
+            schema = self._db.get_schema(TABLE_NAME)
+            if not schema:
+                return {}
+            self._schema = schema
+        return self._schema
+
     def load(self, force: bool = False) -> int:
         """
         Load the Bosworth-Toller dictionary from CSV into DuckDB.
@@ -43,60 +106,123 @@ class BosworthToller:
         Returns:
             Number of rows loaded.
         """
+        self._clear_schema_cache()
         if self._db.table_exists(TABLE_NAME):
-            if not force:
+            missing = set(LOWERCASE_COLUMNS.values()) - set(
+                self._db.get_columns(TABLE_NAME)
+            )
+            if not force and not missing:
                 logger.info("bosworth table already exists, skipping load")
                 return self._db.count(TABLE_NAME)
+            if missing:
+                logger.info("bosworth table predates search columns, reloading")
             logger.info("Dropping existing bosworth table")
             self._db.drop_table(TABLE_NAME)
 
         csv_path = get_asset_path(BT_CSV_ASSET)
         logger.info("Loading Bosworth-Toller from CSV", csv_path=str(csv_path))
 
-        # Load CSV with @ delimiter, no header row, explicit column names and types
-        self._db.conn.execute(
-            f"""
-            CREATE TABLE {TABLE_NAME} AS
-            SELECT * FROM read_csv(
-                '{csv_path}',
-                header=false,
-                delim='@',
-                columns={{'headword': 'VARCHAR', 'definition': 'VARCHAR', 'references': 'VARCHAR'}}
-            )
-        """
-        )
-
-        # Strip HTML tags from the headword (first column)
-        columns = self._db.get_columns(TABLE_NAME)
-        if columns:
-            first_col = _quote_identifier(columns[0])
-            self._db.conn.execute(
+        # Load CSV with @ delimiter, no header row, explicit column names and types.
+        # The reader splits the file into 32 MB buffers across threads.
+        # HTML tags are stripped from the headword, and a cleaned_definition column
+        # (for searching) and the lowercased search columns are derived, in the same
+        # pass that writes the table.
+        with self._db.transaction() as conn:
+            conn.execute(
                 f"""
-                UPDATE {TABLE_NAME}
-                SET {first_col} = regexp_replace({first_col}, '<[^>]+>', '', 'g')
-            """
+                CREATE TABLE {TABLE_NAME} AS
+                SELECT
+                    *,
+                    lower(headword) AS headword_lc,
+                    lower(cleaned_definition) AS cleaned_definition_lc
+                FROM (
+                SELECT
+                    regexp_replace(headword, '<[^>]+>', '', 'g') AS headword,
+                    definition,
+                    "references",
+                    regexp_replace(definition, '<[^>]+>', '', 'g') AS cleaned_definition
+                FROM read_csv(
+                    ?,
+                    header=false,
+                    delim='@',
+                    parallel=true,
+                    buffer_size=33554432,
+                    columns={{
+                        'headword': 'VARCHAR',
+                        'definition': 'VARCHAR',
+                        'references': 'VARCHAR'
+                    }}
+                )
+                )
+            """,
+                [str(csv_path)],
             )
-
-        # Add cleaned_definition column with HTML stripped (for searching)
-        self._db.conn.execute(
-            f"""
-            ALTER TABLE {TABLE_NAME} ADD COLUMN cleaned_definition VARCHAR
-        """
-        )
-        self._db.conn.execute(
-            f"""
-            UPDATE {TABLE_NAME}
-            SET cleaned_definition = regexp_replace(definition, '<[^>]+>', '', 'g')
-        """
-        )
+            # ART index so exact headword lookups probe instead of scanning
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {HEADWORD_INDEX} ON {TABLE_NAME}(headword)"
+            )
+        # An index left over from an opted-in load would point at stale rows
+        self._db.conn.execute(f"DROP SCHEMA IF EXISTS {FTS_SCHEMA} CASCADE")
+        if self._use_fts:
+            self._build_fts_index()
 
         row_count = self._db.count(TABLE_NAME)
-        schema = self._db.get_schema(TABLE_NAME)
         logger.info(
-            "Loaded Bosworth-Toller dictionary", row_count=row_count, schema=schema
+            "Loaded Bosworth-Toller dictionary",
+            row_count=row_count,
+            schema=self.get_schema(),
         )
         return row_count
 
+    def _build_fts_index(self) -> bool:
+        """
+        Build the full-text index used by search(), if the fts extension loads.
+
+        Returns:
+            True if the index was built, False if search() must fall back to LIKE.
+        """
+        global _fts_unavailable
+        conn = self._db.conn
+        self._fts = False
+        if _fts_unavailable:
+            return False
+        try:
+            try:
+                conn.execute("LOAD fts")
+            except duckdb.Error:
+                conn.execute("INSTALL fts")
+                conn.execute("LOAD fts")
+            # Only non-letters separate terms, so æ, þ, ð and other OE letters
+            # stay in the indexed words; no English stemming of OE forms
+            conn.execute(
+                f"PRAGMA create_fts_index('{TABLE_NAME}', 'rowid', "
+                "'headword', 'cleaned_definition', 'references', "
+                "stemmer='none', ignore='(\\.|[^\\pL])+', overwrite=1)"
+            )
+        except duckdb.Error as e:
+            logger.warning("Full-text search unavailable, using LIKE", error=str(e))
+            _fts_unavailable = True
+            return False
+        self._fts = True
+        return True
+
+    def _fts_ready(self) -> bool:
+        """Whether the full-text index exists and the fts extension is loaded."""
+        if self._fts is None:
+            conn = self._db.conn
+            result = conn.execute(
+                "SELECT 1 FROM duckdb_schemas() WHERE schema_name = ? LIMIT 1",
+                [FTS_SCHEMA],
+            ).fetchone()
+            self._fts = False
+            if result is not None:
+                try:
+                    conn.execute("LOAD fts")
+                    self._fts = True
+                except duckdb.Error:
+                    pass
+        return self._fts
+
     def lookup(self, word: str, oper: str = "=") -> List[dict]:
         """
         Look up a word in the dictionary by the first column (headword).
@@ -107,7 +233,7 @@ class BosworthToller:
         Returns:
             List of matching dictionary entries as dictionaries.
         """
-        columns = self._db.get_columns(TABLE_NAME)
+        columns = self.get_columns()
         if not columns:
             return []
 
@@ -115,11 +241,11 @@ class BosworthToller:
             raise ValueError(f"Invalid operator: {oper}")
 
         first_col = _quote_identifier(columns[0])
-        result = self._db.conn.execute(
-            f"SELECT * FROM {TABLE_NAME} WHERE {first_col} {oper.upper()} ?", [word]
-        ).fetchall()
-
-        return [dict(zip(columns, row)) for row in result]
+        return self._db.fetch_dicts(
+            f"SELECT {_ENTRY_COLUMNS} FROM {TABLE_NAME} "
+            f"WHERE {first_col} {oper.upper()} ?",
+            [word],
+        )
 
     def lookup_like(self, pattern: str) -> List[dict]:
         return self.lookup(pattern, oper="LIKE")
@@ -128,53 +254,74 @@ class BosworthToller:
         """
         Search for a term anywhere in the dictionary entries.
 
+        This is a case-insensitive substring match. If the instance was
+        created with fts=True and the index is available, searching all
+        columns instead matches whole words, best matches first.
+
         Args:
-            term: The term to search for (case-insensitive contains).
+            term: The term to search for.
             column: Specific column to search, or None for all columns.
 
         Returns:
             List of matching dictionary entries as dictionaries.
         """
-        logger.info(
-            "Searching dictionary",
-            term=term,
-            column=column,
-            schema=self._db.get_schema(TABLE_NAME),
-        )
-        columns = self._db.get_columns(TABLE_NAME)
-        if not columns:
+        logger.debug("Searching dictionary", term=term, column=column)
+        clauses = self._search_clauses()
+        if not clauses:
             return []
 
-        # Use cleaned_definition for searching instead of definition (which has HTML)
-        # Exclude cleaned_definition from the list since we're substituting it for definition
-        search_columns = [
-            "cleaned_definition" if col == "definition" else col
-            for col in columns
-            if col != "cleaned_definition"
-        ]
-
-        if column and column in columns:
-            search_col = "cleaned_definition" if column == "definition" else column
-            quoted_col = _quote_identifier(search_col)
-            where_clause = f"LOWER({quoted_col}) LIKE LOWER(?)"
-            logger.info("Searching in column", column=column, where_clause=where_clause)
-        else:
-            # Search all columns (using cleaned_definition instead of definition)
-            conditions = [
-                f"LOWER({_quote_identifier(col)}) LIKE LOWER(?)"
-                for col in search_columns
-            ]
-            where_clause = " OR ".join(conditions)
-            logger.info("Searching all columns", where_clause=where_clause)
+        # Omitted and unknown columns search all columns, which uses the index
+        all_columns = column is None or column not in clauses
+        if self._use_fts and all_columns and self._fts_ready():
+            return self._db.fetch_dicts(
+                f"SELECT * EXCLUDE ({_LOWERCASE_LIST}, score) FROM "
+                f"(SELECT *, {FTS_SCHEMA}.match_bm25(rowid, ?) AS score "
+                f"FROM {TABLE_NAME}) WHERE score IS NOT NULL ORDER BY score DESC",
+                [term],
+            )
+
+        # Unknown or omitted columns fall back to searching all columns
+        where_clause, param_count = clauses.get(column, clauses[None])
+        logger.debug("Search where clause", column=column, where_clause=where_clause)
 
-        search_pattern = f"%{term}%"
-        params = [search_pattern] if column else [search_pattern] * len(search_columns)
+        return self._db.fetch_dicts(
+            f"SELECT {_ENTRY_COLUMNS} FROM {TABLE_NAME} WHERE {where_clause}",
+            [f"%{term.lower()}%"] * param_count,
+        )
 
-        result = self._db.conn.execute(
-            f"SELECT * FROM {TABLE_NAME} WHERE {where_clause}", params
-        ).fetchall()
+    def _search_clauses(self) -> dict[Optional[str], Tuple[str, int]]:
+        """
+        Build the search() WHERE clauses once per loaded table.
 
-        return [dict(zip(columns, row)) for row in result]
+        Returns:
+            Mapping of column name (None for "all columns") to the WHERE clause
+            and the number of pattern parameters it takes. Empty if not loaded.
+        """
+        if self._search_where is None:
+            columns = self.get_columns()
+            if not columns:
+                return {}
+
+            # Use cleaned_definition for searching instead of definition (which has
+            # HTML), for a single column as well as for all columns. The pattern is
+            # lowercased by search(), so precomputed lowercase columns compare as-is.
+            def condition(col: str) -> str:
+                search_col = "cleaned_definition" if col == "definition" else col
+                if search_col in LOWERCASE_COLUMNS:
+                    lc_col = _quote_identifier(LOWERCASE_COLUMNS[search_col])
+                    return f"{lc_col} LIKE ?"
+                return f"LOWER({_quote_identifier(search_col)}) LIKE ?"
+
+            clauses: dict[Optional[str], Tuple[str, int]] = {
+                col: (condition(col), 1) for col in columns
+            }
+            # Exclude cleaned_definition since we're substituting it for definition
+            all_conditions = [
+                condition(col) for col in columns if col != "cleaned_definition"
+            ]
+            clauses[None] = (" OR ".join(all_conditions), len(all_conditions))
+            self._search_where = clauses
+        return self._search_where
 
     @property
     def db(self):
@@ -186,10 +333,10 @@ _default_bt: Optional[BosworthToller] = None
 
 
 def get_bt() -> BosworthToller:
-    """Get the default BosworthToller instance."""
+    """Get the default BosworthToller instance, on the shared get_db() connection."""
     global _default_bt
     if _default_bt is None:
-        _default_bt = BosworthToller()
+        _default_bt = BosworthToller(db=get_db())
     return _default_bt
 
 
@@ -12,8 +12,6 @@ from collections import defaultdict
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import requests
-
 from assets import get_asset_path
 from beowulf_mcp.db import BeoDB, _quote_identifier
 from logging_config import get_logger
@@ -279,6 +277,8 @@ class Brunetti:
             logger.info("brunetti table already exists, skipping load")
             return self._db.count(TABLE_NAME)
 
+        import requests  # only needed when the table must be fetched
+
         logger.info("Fetching Brunetti online HTML", url=url)
         response = requests.get(url, timeout=60)
         response.encoding = "utf-8"
@@ -306,20 +306,21 @@ class Brunetti:
     def get_lines(self, start: int = 1, end: Optional[int] = None) -> List[dict]:
         """Get all glosses for a range of lines."""
         cols = ", ".join(CSV_COLUMNS)
-        start_id = str(start).zfill(4)
+        # line_id is zero-padded text; compare numerically so bounds past
+        # 9999 (or unpadded) don't cut the range short.
         if end is None:
             result = self._db.conn.execute(
-                f"SELECT {cols} FROM {TABLE_NAME} WHERE line_id >= ? "
+                f"SELECT {cols} FROM {TABLE_NAME} "
+                f"WHERE CAST(line_id AS INTEGER) >= ? "
                 f"ORDER BY line_id, half_line, token_offset",
-                [start_id],
+                [start],
             ).fetchall()
         else:
-            end_id = str(end).zfill(4)
             result = self._db.conn.execute(
                 f"SELECT {cols} FROM {TABLE_NAME} "
-                f"WHERE line_id >= ? AND line_id <= ? "
+                f"WHERE CAST(line_id AS INTEGER) BETWEEN ? AND ? "
                 f"ORDER BY line_id, half_line, token_offset",
-                [start_id, end_id],
+                [start, end],
             ).fetchall()
         return [dict(zip(CSV_COLUMNS, row)) for row in result]
 
@@ -413,14 +414,13 @@ class Brunetti:
             f"ORDER BY line_id, half_line, token_offset"
         ).fetchall()
 
-        rows = [dict(zip(CSV_COLUMNS, row)) for row in result]
-
+        # Rows come back in CSV_COLUMNS order, so write the tuples as they are
         with output_path.open("w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
-            writer.writeheader()
-            writer.writerows(rows)
+            writer = csv.writer(f)
+            writer.writerow(CSV_COLUMNS)
+            writer.writerows(result)
 
-        logger.info("Wrote CSV", path=str(output_path), rows=len(rows))
+        logger.info("Wrote CSV", path=str(output_path), rows=len(result))
         return output_path
 
     @property
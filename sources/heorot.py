@@ -4,11 +4,9 @@ Beowulf text processing module for heorot.dk data.
 This module handles parsing of the heorot.dk HTML format and persistence to DuckDB.
 """
 
-import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-import requests
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 from beowulf_mcp.db import BeoDB
 from logging_config import get_logger
@@ -26,22 +24,67 @@ def normalize_text(text: str) -> str:
     """
     Normalize text by converting line breaks to spaces and collapsing whitespace.
 
+    '&nbsp;' and the '--' dash used on heorot.dk both count as spaces.
+
     Args:
         text: Raw text from HTML parsing
 
     Returns:
         Normalized text with consistent spacing
     """
-    # Convert HTML entities to spaces (like &nbsp;)
-    text = text.replace("&nbsp;", " ")
+    text = text.replace("&nbsp;", " ").replace("--", " ")
+
+    # str.split() with no separator drops all whitespace runs (line breaks too)
+    # and leading/trailing whitespace in one C-level pass
+    return " ".join(text.split())
+
+
+def _scan_row(row: Tag) -> Tuple[List[Tag], List[Tuple[Tag, Tuple[int, ...]]]]:
+    """
+    Walk a table row once, dropping note divs and collecting c7 spans and links.
 
-    # Convert line breaks and other whitespace to single spaces
-    text = re.sub(r"\s+", " ", text)
+    Divs other than c35 are decomposed as they are reached, so nothing inside
+    them is collected (the c35 exception is a malformation at line 1066 of the
+    Heorot HTML).
 
-    # Remove leading/trailing whitespace
-    text = text.strip()
+    Args:
+        row: A <tr> from a c15 table
 
-    return text
+    Returns:
+        The row's c7 spans in document order, and its <a> tags in document order,
+        each paired with the indexes of the c7 spans that contain it
+    """
+    spans: List[Tag] = []
+    links: List[Tuple[Tag, Tuple[int, ...]]] = []
+    # Depth-first, in document order: (node, indexes of enclosing c7 spans)
+    stack: List[Tuple[Any, Tuple[int, ...]]] = [
+        (child, ()) for child in reversed(row.contents)
+    ]
+    while stack:
+        node, in_spans = stack.pop()
+        if not isinstance(node, Tag):
+            continue
+        if node.name == "div" and node.get("class") != ["c35"]:
+            node.decompose()
+            continue
+        if node.name == "a":
+            links.append((node, in_spans))
+        elif node.name == "span" and "c7" in node.get("class", ()):
+            in_spans = in_spans + (len(spans),)
+            spans.append(node)
+        stack.extend((child, in_spans) for child in reversed(node.contents))
+    return spans, links
+
+
+def _has_c15_class(value: Optional[str]) -> bool:
+    """Whether a class attribute value includes the c15 class token."""
+    return value is not None and "c15" in value.split()
+
+
+# Only the c15 tables hold the text; everything else on the page is skipped.
+# bs4 >= 4.13 matches a plain class_="c15" against the whole attribute value,
+# so tables with further classes (class="c15 x") are matched by token instead.
+_C15_TABLES = SoupStrainer("table", class_=_has_c15_class)
 
 
 def parse(html: str) -> List[Dict[str, Any]]:
@@ -55,7 +98,7 @@ def parse(html: str) -> List[Dict[str, Any]]:
         List of dictionaries containing line data with 'line', 'OE', and 'ME' keys
     """
     current_line_number = 0
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "html.parser", parse_only=_C15_TABLES)
 
     # Extract table or divs containing the two columns
     # Use natural 1-based numbering in the array of lines
@@ -74,16 +117,8 @@ def parse(html: str) -> List[Dict[str, Any]]:
             for row in table_rows:
                 if not isinstance(row, Tag):
                     continue
-                note_divs = row.find_all("div")
-                if len(note_divs) > 0:
-                    for note_div in note_divs:
-                        if note_div.get("class") != [
-                            "c35"
-                        ]:  # malformation at line 1066 of the Heorot HTML
-                            note_div.decompose()
-
-                # Find all span elements with class 'c7' in this row
-                columns = row.find_all("span", class_="c7")
+                # Drop note divs and find the c7 spans and links in one pass
+                columns, links = _scan_row(row)
 
                 if len(columns) >= 2:
                     if len(columns) > 2:
@@ -102,11 +137,12 @@ def parse(html: str) -> List[Dict[str, Any]]:
                     else:
                         last_oe = oe_text
 
-                    # Remove <a> tags
-                    for tag in oe_text.find_all("a"):
-                        tag.unwrap()
-                    for tag in me_text.find_all("a"):
-                        tag.unwrap()
+                    # get_text() already flattens <a> tags, so only the OE span's
+                    # links are unwrapped: the next row's duplicate check compares
+                    # against this (unwrapped) span, and line numbering depends on it
+                    for tag, in_spans in links:
+                        if 0 in in_spans:
+                            tag.unwrap()
 
                     current_line_number += 1
 
@@ -114,16 +150,13 @@ def parse(html: str) -> List[Dict[str, Any]]:
                     oe_raw = oe_text.get_text(strip=False)
                     me_raw = me_text.get_text(strip=False)
 
-                    # Normalize the text to handle line breaks and whitespace
-                    oe_normalized = normalize_text(oe_raw)
-                    me_normalized = normalize_text(me_raw)
-
-                    # Handle the special case of '--' which should be preserved as space
-                    oe_final = oe_normalized.replace("--", " ")
-                    me_final = me_normalized.replace("--", " ")
-
+                    # Normalize the text to handle line breaks, whitespace and '--'
                     lines.append(
-                        {"line": current_line_number, "OE": oe_final, "ME": me_final}
+                        {
+                            "line": current_line_number,
+                            "OE": normalize_text(oe_raw),
+                            "ME": normalize_text(me_raw),
+                        }
                     )
 
     return lines
@@ -207,6 +240,8 @@ class Heorot:
             logger.info("heorot table already exists, skipping load")
             return self._db.count(TABLE_NAME)
 
+        import requests  # only needed when the table must be fetched
+
         logger.info("Fetching HTML from URL", url=url)
         response = requests.get(url)
         response.raise_for_status()
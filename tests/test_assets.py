@@ -0,0 +1,27 @@
+"""Tests for the asset loading utilities."""
+
+from assets import (
+    clear_asset_cache,
+    get_asset_path,
+    read_asset_bytes,
+    read_asset_text,
+)
+
+
+class TestAssetCache:
+    """Tests for memoized asset access."""
+
+    def test_reads_are_cached(self) -> None:
+        """Repeated reads of the same asset should return the cached object."""
+        clear_asset_cache()
+        assert read_asset_text("blank.ass") is read_asset_text("blank.ass")
+        assert read_asset_bytes("blank.ass") is read_asset_bytes("blank.ass")
+        assert get_asset_path("blank.ass") is get_asset_path("blank.ass")
+
+    def test_clear_asset_cache(self) -> None:
+        """Clearing the cache should force the next read to hit the file again."""
+        first = read_asset_bytes("blank.ass")
+        clear_asset_cache()
+        second = read_asset_bytes("blank.ass")
+        assert second == first
+        assert read_asset_bytes.cache_info().currsize == 1
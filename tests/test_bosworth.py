@@ -6,7 +6,7 @@ from typing import Generator
 import pytest
 
 from beowulf_mcp.db import BeoDB, _quote_identifier
-from sources.bosworth import TABLE_NAME, BosworthToller
+from sources.bosworth import FTS_SCHEMA, HEADWORD_INDEX, TABLE_NAME, BosworthToller
 
 
 @pytest.fixture
@@ -71,10 +71,59 @@ class TestBosworthToller:
             count = bt.load(force=True)
             assert count == 5
 
+    def test_load_path_with_quote(
+        self, tmp_path: Path, sample_csv: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """CSV paths containing quotes should load (path is bound, not inlined)."""
+        quoted_dir = tmp_path / "it's"
+        quoted_dir.mkdir()
+        quoted_csv = quoted_dir / "oe_bt.csv"
+        quoted_csv.write_bytes(sample_csv.read_bytes())
+        monkeypatch.setattr(
+            "sources.bosworth.get_asset_path", lambda filename: quoted_csv
+        )
+
+        with BosworthToller(db=BeoDB(tmp_path / "quoted.duckdb")) as bt:
+            assert bt.load() == 5
+
     def test_get_columns(self, bt_with_data: BosworthToller) -> None:
         """Should return correct column names."""
         columns = bt_with_data._db.get_columns(TABLE_NAME)
+        assert columns == [
+            "headword",
+            "definition",
+            "references",
+            "cleaned_definition",
+            "headword_lc",
+            "cleaned_definition_lc",
+        ]
+
+    def test_get_columns_cached(self, bt_with_data: BosworthToller) -> None:
+        """Column names should be fetched once and reused until reload."""
+        columns = bt_with_data.get_columns()
         assert columns == ["headword", "definition", "references", "cleaned_definition"]
+        assert bt_with_data.get_columns() is columns
+        bt_with_data.load(force=True)
+        assert bt_with_data.get_columns() is not columns
+
+    def test_lowercase_columns_hidden(self, bt_with_data: BosworthToller) -> None:
+        """Lowercased search columns should not appear in returned entries."""
+        for entry in bt_with_data.lookup("cyning") + bt_with_data.search("KING"):
+            assert "headword_lc" not in entry
+            assert "cleaned_definition_lc" not in entry
+
+    def test_load_reloads_table_without_lowercase_columns(
+        self, tmp_path: Path, sample_csv: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A bosworth table from before the lowercase columns should be reloaded."""
+        monkeypatch.setattr(
+            "sources.bosworth.get_asset_path", lambda filename: sample_csv
+        )
+
+        with BosworthToller(db=BeoDB(tmp_path / "old_table.duckdb")) as bt:
+            bt._db.conn.execute(f"CREATE TABLE {TABLE_NAME} (headword VARCHAR)")
+            assert bt.load() == 5
+            assert len(bt.search("cyn")) == 3
 
     def test_lookup_exact_match(self, bt_with_data: BosworthToller) -> None:
         """Lookup should find exact headword matches."""
@@ -134,6 +183,84 @@ class TestBosworthToller:
         results = bt_with_data.search("Beowulf", column="references")
         assert len(results) == 5  # All entries have Beowulf references
 
+    def test_search_unknown_column_searches_all(
+        self, bt_with_data: BosworthToller
+    ) -> None:
+        """An unknown column should fall back to searching all columns."""
+        assert bt_with_data.search("warrior", column="nope") == bt_with_data.search(
+            "warrior"
+        )
+
+    def test_search_defaults_to_like(self, bt_with_data: BosworthToller) -> None:
+        """Without opting in, search() should match substrings and build no index."""
+        headwords = [r["headword"] for r in bt_with_data.search("cyn")]
+        assert sorted(headwords) == ["cyne-rīce", "cyning", "cynn"]
+        assert bt_with_data._db.conn.execute(
+            "SELECT COUNT(*) FROM duckdb_schemas() WHERE schema_name = ?",
+            [FTS_SCHEMA],
+        ).fetchone() == (0,)
+
+    def test_search_fts_unavailable_uses_like(
+        self, tmp_path: Path, sample_csv: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Opted in but without the fts extension, search() should use LIKE."""
+        monkeypatch.setattr(
+            "sources.bosworth.get_asset_path", lambda filename: sample_csv
+        )
+        monkeypatch.setattr("sources.bosworth._fts_unavailable", True)
+
+        with BosworthToller(db=BeoDB(tmp_path / "no_fts.duckdb"), fts=True) as bt:
+            bt.load()
+            assert bt._fts_ready() is False
+            headwords = [r["headword"] for r in bt.search("cyn")]
+            assert sorted(headwords) == ["cyne-rīce", "cyning", "cynn"]
+
+    def test_search_fts_keeps_oe_letters(
+        self, tmp_path: Path, sample_csv: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """An opted-in full-text index should find words containing OE letters."""
+        monkeypatch.setattr(
+            "sources.bosworth.get_asset_path", lambda filename: sample_csv
+        )
+
+        with BosworthToller(db=BeoDB(tmp_path / "fts.duckdb"), fts=True) as bt:
+            bt.load()
+            if not bt._fts_ready():
+                pytest.skip("DuckDB fts extension not available")
+            assert [r["headword"] for r in bt.search("rīce")] == ["cyne-rīce"]
+            assert [r["headword"] for r in bt.search("warrior")] == ["beorn"]
+
+    def test_search_fts_matches_whole_words(
+        self, tmp_path: Path, sample_csv: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """An opted-in all-column search should match whole words only."""
+        monkeypatch.setattr(
+            "sources.bosworth.get_asset_path", lambda filename: sample_csv
+        )
+
+        with BosworthToller(db=BeoDB(tmp_path / "fts.duckdb"), fts=True) as bt:
+            bt.load()
+            if not bt._fts_ready():
+                pytest.skip("DuckDB fts extension not available")
+            # LIKE would also return cyne-rīce for "kingdom"
+            assert [r["headword"] for r in bt.search("king")] == ["cyning"]
+
+    def test_search_fts_used_for_all_columns(
+        self, bt_with_data: BosworthToller, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """With the index ready, only a named column should bypass BM25."""
+        queries: list[str] = []
+        monkeypatch.setattr(bt_with_data, "_use_fts", True)
+        monkeypatch.setattr(bt_with_data, "_fts_ready", lambda: True)
+        monkeypatch.setattr(
+            bt_with_data._db, "fetch_dicts", lambda sql, params: queries.append(sql)
+        )
+
+        bt_with_data.search("king")
+        bt_with_data.search("king", column="nonexistent")
+        bt_with_data.search("king", column="headword")
+        assert ["match_bm25" in sql for sql in queries] == [True, True, False]
+
     def test_cleaned_definition_exists(self, bt_with_data: BosworthToller) -> None:
         """Should have cleaned_definition column without HTML."""
         results = bt_with_data.lookup("cyning")
@@ -144,6 +271,14 @@ class TestBosworthToller:
         assert "<" not in results[0]["cleaned_definition"]
         assert ">" not in results[0]["cleaned_definition"]
 
+    def test_headword_index_created(self, bt_with_data: BosworthToller) -> None:
+        """Loading should create an index on the headword column."""
+        result = bt_with_data._db.conn.execute(
+            "SELECT COUNT(*) FROM duckdb_indexes() WHERE index_name = ?",
+            [HEADWORD_INDEX],
+        ).fetchone()
+        assert result is not None and result[0] == 1
+
     def test_context_manager(self, tmp_path: Path) -> None:
         """Context manager should properly close connection."""
         with BosworthToller(db=BeoDB(tmp_path / "context.duckdb")) as bt:
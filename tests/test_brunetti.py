@@ -296,6 +296,14 @@ class TestBrunetti:
         line_ids = {r["line_id"] for r in result}
         assert line_ids == {"0001", "0002"}
 
+    def test_get_lines_end_past_padding(self, tmp_path: Path) -> None:
+        html = SAMPLE_HTML.replace(">0552<", ">3182<")
+        with Brunetti(db=BeoDB(tmp_path / "test_br.duckdb")) as br:
+            br.load_from_html(html)
+            result = br.get_lines(2, 10000)
+        line_ids = {r["line_id"] for r in result}
+        assert line_ids == {"0002", "3182"}
+
     def test_get_lines_from_start(self, br_with_data: Brunetti) -> None:
         result = br_with_data.get_lines(2)
         line_ids = {r["line_id"] for r in result}
@@ -0,0 +1,231 @@
+"""Tests for the beodata command-line helpers."""
+
+import threading
+from collections.abc import Callable, Iterator
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+import pytest
+import requests
+
+from beowulf_mcp import cli
+
+# Builds the response to one GET request on the test HTTP server
+Respond = Callable[[BaseHTTPRequestHandler], None]
+
+
+@pytest.fixture
+def serve() -> Iterator[Callable[[Respond], str]]:
+    """Start local HTTP servers answering GETs with a callback; yield a starter."""
+    servers: list[HTTPServer] = []
+
+    def start(respond: Respond) -> str:
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                respond(self)
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_port}/"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Point DATA_DIR at tmp_path, with fetch_and_store()'s memo empty around it."""
+    monkeypatch.setattr(cli, "DATA_DIR", tmp_path)
+    cli.fetch_and_store.cache_clear()
+    yield tmp_path
+    cli.fetch_and_store.cache_clear()
+
+
+class TestFetchAndStore:
+    """Tests for fetch_and_store()."""
+
+    def test_stored_file_read_once(self, data_dir: Path) -> None:
+        """A stored file should be read once and then served from memory."""
+        stored = data_dir / "page.html"
+        stored.write_text("<p>hwæt</p>", encoding="utf-8")
+
+        assert cli.fetch_and_store("https://example.invalid/", "page.html") == (
+            "<p>hwæt</p>"
+        )
+        stored.write_text("changed", encoding="utf-8")
+        assert cli.fetch_and_store("https://example.invalid/", "page.html") == (
+            "<p>hwæt</p>"
+        )
+
+    def test_fetch_streams_to_disk(
+        self, data_dir: Path, serve: Callable[[Respond], str]
+    ) -> None:
+        """A missing file should be fetched, stored as UTF-8 and returned."""
+        body = "<p>Hwæt! wē Gār-Dena</p>".encode("utf-8")
+
+        def respond(handler: BaseHTTPRequestHandler) -> None:
+            handler.send_response(200)
+            handler.send_header("Content-Type", "text/html; charset=utf-8")
+            handler.send_header("Content-Length", str(len(body)))
+            handler.end_headers()
+            handler.wfile.write(body)
+
+        text = cli.fetch_and_store(serve(respond), "fetched.html")
+        assert text == body.decode("utf-8")
+        assert (data_dir / "fetched.html").read_text(encoding="utf-8") == text
+
+    def test_truncated_fetch_not_stored(
+        self, data_dir: Path, serve: Callable[[Respond], str]
+    ) -> None:
+        """A download cut short should leave no stored page behind."""
+        body = b"<p>Hwaet</p>"
+
+        def respond(handler: BaseHTTPRequestHandler) -> None:
+            handler.send_response(200)
+            handler.send_header("Content-Type", "text/html; charset=utf-8")
+            handler.send_header("Content-Length", str(len(body) * 2))
+            handler.end_headers()
+            handler.wfile.write(body)
+
+        with pytest.raises(requests.RequestException):
+            cli.fetch_and_store(serve(respond), "cut.html")
+        assert list(data_dir.iterdir()) == []
+
+    def test_fetch_detects_undeclared_encoding(
+        self, data_dir: Path, serve: Callable[[Respond], str]
+    ) -> None:
+        """Without a declared charset, the encoding is detected as .text does."""
+        body = "<p>Hwæt! wē Gār-Dena, þēodcyninga þrym gefrūnon</p>".encode("utf-8")
+
+        def respond(handler: BaseHTTPRequestHandler) -> None:
+            handler.send_response(200)
+            handler.send_header("Content-Length", str(len(body)))
+            handler.end_headers()
+            handler.wfile.write(body)
+
+        text = cli.fetch_and_store(serve(respond), "undeclared.html")
+        assert text == body.decode("utf-8")
+        assert (data_dir / "undeclared.html").read_text(encoding="utf-8") == text
+
+    def test_fetch_with_forced_encoding(
+        self, data_dir: Path, serve: Callable[[Respond], str]
+    ) -> None:
+        """An explicit encoding should override the ISO-8859-1 text/html default."""
+        body = "<p>Hwæt! wē Gār-Dena</p>".encode("utf-8")
+
+        def respond(handler: BaseHTTPRequestHandler) -> None:
+            handler.send_response(200)
+            handler.send_header("Content-Type", "text/html")
+            handler.send_header("Content-Length", str(len(body)))
+            handler.end_headers()
+            handler.wfile.write(body)
+
+        text = cli.fetch_and_store(serve(respond), "forced.html", encoding="utf-8")
+        assert text == body.decode("utf-8")
+        assert (data_dir / "forced.html").read_text(encoding="utf-8") == text
+
+    def test_refresh_stored_conditional_get(
+        self, data_dir: Path, serve: Callable[[Respond], str]
+    ) -> None:
+        """Revalidation should send the saved ETag and keep the file on a 304."""
+        body = b"<p>Hwaet</p>"
+        seen: list = []
+
+        def respond(handler: BaseHTTPRequestHandler) -> None:
+            seen.append(handler.headers.get("If-None-Match"))
+            if handler.headers.get("If-None-Match") == '"v1"':
+                handler.send_response(304)
+                handler.end_headers()
+                return
+            handler.send_response(200)
+            handler.send_header("ETag", '"v1"')
+            handler.send_header("Content-Length", str(len(body)))
+            handler.end_headers()
+            handler.wfile.write(body)
+
+        url = serve(respond)
+        assert cli.fetch_and_store(url, "page.html") == "<p>Hwaet</p>"
+        assert cli.refresh_stored(url, "page.html") == "<p>Hwaet</p>"
+        assert seen == [None, '"v1"']
+        (data_dir / "page.html.meta.json").unlink()
+        assert cli.refresh_stored(url, "page.html") == "<p>Hwaet</p>"
+        assert seen == [None, '"v1"', None]
+
+    @pytest.mark.parametrize("argv, refreshed", [([], False), (["--refresh"], True)])
+    def test_load_heorot_refresh_flag(
+        self, monkeypatch: pytest.MonkeyPatch, argv: list[str], refreshed: bool
+    ) -> None:
+        """load_heorot should revalidate the stored page only with --refresh."""
+        calls: list[str] = []
+
+        class FakeHeorot:
+            def load_from_html(self, html: str, force: bool = False) -> None:
+                pass
+
+        monkeypatch.setattr(cli.sys, "argv", ["heorot", *argv])
+        monkeypatch.setattr(cli, "refresh_stored", lambda url, name: calls.append(name))
+        monkeypatch.setattr(cli, "fetch_store_parse_and_write", lambda *args: None)
+        monkeypatch.setattr(cli, "fetch_and_store", lambda url, name: "")
+        monkeypatch.setattr(cli, "Heorot", FakeHeorot)
+
+        cli.load_heorot()
+        assert calls == (["maintext.html"] if refreshed else [])
+
+
+class TestParseCache:
+    """Tests for the on-disk cache of parsed lines."""
+
+    def test_parse_once_per_html(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Unchanged HTML should be parsed once; changed HTML invalidates it."""
+        calls: list[str] = []
+
+        def fake_parse(html: str) -> list:
+            calls.append(html)
+            return [{"line": 0, "OE": "", "ME": ""}, {"line": 1, "OE": html}]
+
+        monkeypatch.setattr(cli, "DATA_DIR", tmp_path)
+        monkeypatch.setattr(cli, "parse", fake_parse)
+
+        first = cli._parse_cached("maintext", "Hwæt")
+        assert cli._parse_cached("maintext", "Hwæt") == first
+        assert calls == ["Hwæt"]
+        assert (tmp_path / "maintext.lines.json").exists()
+        assert not list(tmp_path.glob("*.tmp"))
+
+        assert cli._parse_cached("maintext", "Hwæt!")[1]["OE"] == "Hwæt!"
+        assert calls == ["Hwæt", "Hwæt!"]
+
+    def test_parsed_lines_memoized(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """In-process calls should reuse parsed lines and hand out copies."""
+        calls: list[str] = []
+
+        def fake_parse(html: str) -> list:
+            calls.append(html)
+            return [{"line": 0, "OE": "", "ME": ""}]
+
+        monkeypatch.setattr(cli, "DATA_DIR", tmp_path)
+        monkeypatch.setattr(cli, "parse", fake_parse)
+        cli.fetch_and_store.cache_clear()
+        cli._parsed_lines.cache_clear()
+        (tmp_path / "maintext.html").write_text("<p>Hwæt</p>", encoding="utf-8")
+
+        try:
+            first = cli.fetch_store_and_parse("maintext", "https://example.invalid/")
+            first[0]["OE"] = "changed"
+            (tmp_path / "maintext.lines.json").unlink()
+            second = cli.fetch_store_and_parse("maintext", "https://example.invalid/")
+            assert second == [{"line": 0, "OE": "", "ME": ""}]
+            assert calls == ["<p>Hwæt</p>"]
+        finally:
+            cli.fetch_and_store.cache_clear()
+            cli._parsed_lines.cache_clear()
@@ -0,0 +1,40 @@
+"""Tests for the CSV writer."""
+
+from pathlib import Path
+
+import pytest
+
+from writers.csv_writer import CsvWriter
+
+
+class TestCsvWriter:
+    """Tests for CsvWriter.write()."""
+
+    def test_writes_rows_in_header_order(self, tmp_path: Path) -> None:
+        path = tmp_path / "lines.csv"
+        lines = [
+            {"line": 1, "OE": "Hwæt! We Gardena", "ME": "Lo! We of the Spear-Danes"},
+            {"line": 2, "OE": "þeodcyninga, þrym", "ME": "of the kings, glory"},
+        ]
+        CsvWriter().write(lines, path)
+        assert path.read_text(encoding="utf-8").splitlines() == [
+            "line,OE,ME",
+            "1,Hwæt! We Gardena,Lo! We of the Spear-Danes",
+            '2,"þeodcyninga, þrym","of the kings, glory"',
+        ]
+
+    def test_extra_key_raises(self, tmp_path: Path) -> None:
+        """A row with a key outside the header is an error, as with DictWriter."""
+        lines = [{"line": 1, "OE": "a"}, {"line": 2, "OE": "b", "ME": "c"}]
+        with pytest.raises(ValueError, match="fields not in fieldnames"):
+            CsvWriter().write(lines, tmp_path / "lines.csv")
+
+    def test_missing_key_written_empty(self, tmp_path: Path) -> None:
+        """A row missing a header key gets an empty cell, as with DictWriter."""
+        path = tmp_path / "lines.csv"
+        CsvWriter().write([{"line": 1, "OE": "a"}, {"line": 2}], path)
+        assert path.read_text(encoding="utf-8").splitlines() == [
+            "line,OE",
+            "1,a",
+            "2,",
+        ]
@@ -0,0 +1,116 @@
+"""Tests for the BeoDB database manager."""
+
+from pathlib import Path
+
+import pytest
+
+from beowulf_mcp.db import BeoDB, get_db, reset_db
+
+
+class TestTransaction:
+    """Tests for BeoDB.transaction()."""
+
+    def test_commits_on_success(self, tmp_path: Path) -> None:
+        """Statements inside the block should be committed together."""
+        with BeoDB(tmp_path / "txn_commit.duckdb") as db:
+            with db.transaction() as conn:
+                conn.execute("CREATE TABLE t (x INTEGER)")
+                conn.executemany("INSERT INTO t VALUES (?)", [(1,), (2,), (3,)])
+            assert db.table_exists("t")
+            assert db.count("t") == 3
+
+    def test_rolls_back_on_error(self, tmp_path: Path) -> None:
+        """An exception inside the block should undo every statement in it."""
+        with BeoDB(tmp_path / "txn_rollback.duckdb") as db:
+            with pytest.raises(RuntimeError):
+                with db.transaction() as conn:
+                    conn.execute("CREATE TABLE t (x INTEGER)")
+                    conn.execute("INSERT INTO t VALUES (1)")
+                    raise RuntimeError("boom")
+            assert db.table_exists("t") is False
+
+
+class TestFetchDicts:
+    """Tests for BeoDB.fetch_dicts()."""
+
+    def test_rows_keyed_by_result_columns(self, tmp_path: Path) -> None:
+        """Rows should be dicts keyed by the query's own column names."""
+        with BeoDB(tmp_path / "fetch_dicts.duckdb") as db:
+            rows = db.fetch_dicts("SELECT ? AS a, 2 AS b", ["x"])
+            assert rows == [{"a": "x", "b": 2}]
+
+    def test_no_rows(self, tmp_path: Path) -> None:
+        """An empty result should give an empty list."""
+        with BeoDB(tmp_path / "fetch_dicts_empty.duckdb") as db:
+            assert db.fetch_dicts("SELECT 1 AS a WHERE false") == []
+
+
+class TestPrepare:
+    """Tests for BeoDB.prepare()."""
+
+    def test_statement_reused(self, tmp_path: Path) -> None:
+        """The same SQL should be parsed once and then reused."""
+        with BeoDB(tmp_path / "prepare.duckdb") as db:
+            sql = "SELECT ? + 1 AS n"
+            statement = db.prepare(sql)
+            assert db.prepare(sql) is statement
+            assert db.conn.execute(statement, [41]).fetchone() == (42,)
+
+    def test_metadata_statements_rebind(self, tmp_path: Path) -> None:
+        """Reused metadata statements should see tables created after parsing."""
+        with BeoDB(tmp_path / "prepare_rebind.duckdb") as db:
+            assert db.table_exists("t") is False
+            assert db.list_tables() == []
+            db.conn.execute("CREATE TABLE t AS SELECT 1 AS x")
+            assert db.table_exists("t") is True
+            assert db.count("t") == 1
+            db.drop_table("t")
+            db.conn.execute("CREATE TABLE t AS SELECT * FROM range(3)")
+            assert db.count("t") == 3
+            assert db.list_tables() == ["t"]
+
+    def test_cache_cleared_on_close(self, tmp_path: Path) -> None:
+        """Closing the connection should drop the parsed statements."""
+        db = BeoDB(tmp_path / "prepare_close.duckdb")
+        statement = db.prepare("SELECT 1")
+        db.close()
+        assert db.prepare("SELECT 1") is not statement
+        db.close()
+
+
+class TestDefaultDB:
+    """Tests for the shared get_db() instance."""
+
+    def test_sources_share_default_db(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Default source instances should reuse the one shared BeoDB."""
+        from sources.abbreviations import get_abbreviations
+        from sources.bosworth import get_bt
+
+        monkeypatch.setattr("sources.bosworth._default_bt", None)
+        monkeypatch.setattr("sources.abbreviations._default_abbr_instance", None)
+        reset_db()
+        try:
+            assert get_db() is get_db()
+            assert get_bt().db is get_db()
+            assert get_abbreviations()._db is get_db()
+        finally:
+            reset_db()
+
+
+class TestSchemaCache:
+    """Tests for the cached get_schema()/get_columns()."""
+
+    def test_schema_cached_until_drop(self, tmp_path: Path) -> None:
+        """The catalog should be read once per table and re-read after a drop."""
+        with BeoDB(tmp_path / "schema_cache.duckdb") as db:
+            assert db.get_columns("t") == []
+            db.conn.execute("CREATE TABLE t (a INTEGER, b VARCHAR)")
+            assert db.get_schema("t") == {"a": "INTEGER", "b": "VARCHAR"}
+            assert db._schema_cache["t"] == {"a": "INTEGER", "b": "VARCHAR"}
+
+            db.get_columns("t").append("mutated")
+            assert db.get_columns("t") == ["a", "b"]
+
+            db.drop_table("t")
+            db.conn.execute("CREATE TABLE t (c DOUBLE)")
+            assert db.get_columns("t") == ["c"]
@@ -13,7 +13,7 @@ from typing import Any, Generator, List
 import pytest
 
 from beowulf_mcp.db import BeoDB
-from sources.heorot import TABLE_NAME, Heorot
+from sources.heorot import TABLE_NAME, Heorot, normalize_text, parse
 from text.numbering import FITT_BOUNDARIES
 
 
@@ -237,3 +237,73 @@ class TestHeorotClass:
         with Heorot(db=BeoDB(tmp_path / "context.duckdb")) as h:
             assert h._db._conn is not None or h._db.table_exists(TABLE_NAME) is False
         assert h._db._conn is None
+
+
+class TestParse:
+    """Tests for parse() on heorot-shaped HTML."""
+
+    def test_notes_links_and_dupes(self) -> None:
+        """Note divs (except c35) are dropped, links unwrapped, repeats skipped."""
+        html = """
+        <table class="c15">
+            <tr>
+                <td><span class="c7">Hwæt! We<div class="c9">
+                    a footnote</div> Gardena</span></td>
+                <td><span class="c7">Lo! We of the--Spear-Danes</span></td>
+            </tr>
+            <tr>
+                <td><span class="c7">Hwæt! We<div class="c9">
+                    a footnote</div> Gardena</span></td>
+                <td><span class="c7">duplicate row</span></td>
+            </tr>
+            <tr>
+                <td><span class="c7"><a href="#2">in</a> geardagum<div
+                    class="c35">,</div></span></td>
+                <td><span class="c7">in <a href="#3">days</a> of yore</span></td>
+            </tr>
+        </table>
+        """
+        assert parse(html) == [
+            {"line": 0, "OE": "", "ME": ""},
+            {"line": 1, "OE": "Hwæt! We Gardena", "ME": "Lo! We of the Spear-Danes"},
+            {"line": 2, "OE": "in geardagum,", "ME": "in days of yore"},
+        ]
+
+    def test_multi_class_table(self) -> None:
+        """Tables whose class list includes c15 among others are parsed too."""
+        html = """
+        <table class="c15 x">
+            <tr>
+                <td><span class="c7">Hwæt! We Gardena</span></td>
+                <td><span class="c7">Lo! We of the Spear-Danes</span></td>
+            </tr>
+        </table>
+        <table class="c150">
+            <tr>
+                <td><span class="c7">not text</span></td>
+                <td><span class="c7">not text</span></td>
+            </tr>
+        </table>
+        """
+        assert parse(html) == [
+            {"line": 0, "OE": "", "ME": ""},
+            {"line": 1, "OE": "Hwæt! We Gardena", "ME": "Lo! We of the Spear-Danes"},
+        ]
+
+    def test_unclosed_cell(self) -> None:
+        """Malformed cells keep html.parser's reading, which line text relies on."""
+        html = """
+        <table class="c15"><tr>
+            <td><span class="c7">a b<td><span class="c7">c</span>d</span>
+            <td><span class="c7">e</span></td>
+        </tr></table>
+        """
+        assert parse(html) == [
+            {"line": 0, "OE": "", "ME": ""},
+            {"line": 1, "OE": "a bcd", "ME": "e"},
+        ]
+
+    def test_normalize_text(self) -> None:
+        """Whitespace, &nbsp; and '--' collapse to single inner spaces."""
+        assert normalize_text("  Hwæt!\n\twe&nbsp;Gar-Dena  ") == "Hwæt! we Gar-Dena"
+        assert normalize_text("þrym -- gefrunon--") == "þrym gefrunon"
@@ -1,4 +1,4 @@
-from text.numbering import FITT_BOUNDARIES
+from text.numbering import FITT_BOUNDARIES, FITT_OF_LINE
 
 
 def test_fitt_coverage_complete() -> None:
@@ -12,3 +12,12 @@ def test_fitt_coverage_complete() -> None:
     expected_lines = set(range(1, 3183))
     missing = expected_lines - covered_lines
     assert not missing, f"Lines not covered by fitts: {sorted(missing)[:10]}..."
+
+
+def test_fitt_of_line_matches_boundaries() -> None:
+    """FITT_OF_LINE should map each line to the fitt whose range contains it."""
+    assert set(FITT_OF_LINE) == set(range(1, 3183))
+    for line_number, fitt_id in FITT_OF_LINE.items():
+        start, end, _name = FITT_BOUNDARIES[fitt_id]
+        assert start <= line_number <= end
+    assert 0 not in FITT_OF_LINE  # line 0 only falls in the placeholder fitt 24
@@ -147,6 +147,20 @@ class TestReadResources:
         assert isinstance(data, list)
         assert len(data) >= 5
 
+    async def test_repeated_read_identical(self, mcp_session: ClientSession) -> None:
+        """Reading the same resource twice returns the same document."""
+        uri = "beowulf://text/heorot/line/1/5"
+        first = await mcp_session.read_resource(uri)
+        second = await mcp_session.read_resource(uri)
+
+        assert len(first.contents) == len(second.contents) == 1
+
+        a, b = first.contents[0], second.contents[0]
+        text_a = a.text if hasattr(a, "text") else str(a)
+        text_b = b.text if hasattr(b, "text") else str(b)
+        assert text_a == text_b
+        assert len(json.loads(text_a)) >= 5
+
 
 @pytest.mark.asyncio(loop_scope="module")
 class TestCallTools:
@@ -298,6 +312,19 @@ class TestBosworthTools:
         assert "definition" in entry
         assert "references" in entry
 
+    async def test_bt_lookup_repeated(self, mcp_session: ClientSession) -> None:
+        """Repeating a bt_lookup returns the same results."""
+        texts = []
+        for _ in range(2):
+            result = await mcp_session.call_tool(
+                name="bt_lookup", arguments={"word": "cyning"}
+            )
+            content = result.content[0]
+            texts.append(content.text if hasattr(content, "text") else str(content))
+
+        assert texts[0] == texts[1]
+        assert json.loads(texts[0])["count"] >= 1
+
     async def test_bt_lookup_no_match(self, mcp_session: ClientSession) -> None:
         """bt_lookup returns empty results for gibberish."""
         result = await mcp_session.call_tool(
@@ -0,0 +1,139 @@
+"""In-process tests for the MCP server's dispatch and caches, without network."""
+
+from collections import OrderedDict
+from types import ModuleType
+from typing import Any, Iterator
+
+import pytest
+from pydantic import AnyUrl
+
+from beowulf_mcp import server
+
+
+class StubSource(ModuleType):
+    """Stand-in source module that counts load() and query calls."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.calls: list[tuple[Any, ...]] = []
+
+    def load(self) -> None:
+        self.calls.append(("load",))
+
+    def lookup(self, key: str) -> list[dict]:
+        self.calls.append(("lookup", key))
+        return [{"key": key}]
+
+    def get_lines(self, start: int = 1, end: int | None = None) -> list[dict]:
+        self.calls.append(("get_lines", start, end))
+        return [{"line": start, "text": "x" * 10}]
+
+    def search(self, term: str) -> list[dict]:
+        self.calls.append(("search", term))
+        return [{"term": term}]
+
+
+@pytest.fixture
+def stub(monkeypatch: pytest.MonkeyPatch) -> Iterator[StubSource]:
+    """A fresh stub source, with the server's loaded set and caches empty."""
+    monkeypatch.setattr(server, "_loaded_modules", set())
+    monkeypatch.setattr(server, "_resource_json", OrderedDict())
+    monkeypatch.setattr(server, "_resource_json_chars", 0)
+    server._lookup.cache_clear()
+    yield StubSource("stub_source")
+    server._lookup.cache_clear()
+
+
+class TestArgumentValidation:
+    """Tests for _str_arg() and the handlers that use it."""
+
+    def test_str_arg_returns_string(self) -> None:
+        assert server._str_arg({"word": "cyning"}, "word") == "cyning"
+
+    @pytest.mark.parametrize("value", [["cyning"], {"w": 1}, 7, None])
+    def test_str_arg_rejects_non_strings(self, value: Any) -> None:
+        with pytest.raises(ValueError, match="word must be a string"):
+            server._str_arg({"word": value}, "word")
+
+    async def test_lookup_tool_rejects_unhashable_arg(self) -> None:
+        """A list argument should be a ValueError, not a TypeError from the cache."""
+        with pytest.raises(ValueError, match="word must be a string"):
+            await server.call_tool("bt_lookup", {"word": ["cyning"]})
+
+
+class TestLookupCache:
+    """Tests for the exact-key _lookup() cache."""
+
+    def test_repeated_lookup_hits_cache(self, stub: StubSource) -> None:
+        first = server._lookup(stub, "lookup", "cyning")
+        second = server._lookup(stub, "lookup", "cyning")
+        assert first == second == [{"key": "cyning"}]
+        assert stub.calls == [("load",), ("lookup", "cyning")]
+
+    def test_distinct_keys_query_separately(self, stub: StubSource) -> None:
+        server._lookup(stub, "lookup", "cyning")
+        server._lookup(stub, "lookup", "cynn")
+        assert stub.calls == [("load",), ("lookup", "cyning"), ("lookup", "cynn")]
+
+
+class TestDispatch:
+    """Tests for call_tool() routing."""
+
+    async def test_edition_tool_dispatch(
+        self, stub: StubSource, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setitem(
+            server._EDITION_TOOL_DISPATCH, "stub_search", (stub, "search")
+        )
+        result = await server.call_tool("stub_search", {"term": "hwæt"})
+        assert '"count": 1' in result.content[0].text
+        assert stub.calls == [("load",), ("search", "hwæt")]
+
+    async def test_unknown_tool(self) -> None:
+        with pytest.raises(ValueError, match="Unknown tool: nonexistent"):
+            await server.call_tool("nonexistent", {})
+
+
+class TestResourceCache:
+    """Tests for the size-bounded cache of encoded resource reads."""
+
+    @pytest.fixture
+    def edition(self, stub: StubSource, monkeypatch: pytest.MonkeyPatch) -> StubSource:
+        """Serve the stub as beowulf://text/stub."""
+        monkeypatch.setitem(server._RESOURCE_EDITIONS, "stub", {"module": stub})
+        return stub
+
+    async def _read(self, uri: str) -> str:
+        contents = await server.read_resource(AnyUrl(uri))
+        return str(contents[0].content)
+
+    async def test_repeat_read_hits_cache(self, edition: StubSource) -> None:
+        first = await self._read("beowulf://text/stub/line/1/5")
+        second = await self._read("beowulf://text/stub/line/1/5")
+        assert first == second
+        assert edition.calls == [("load",), ("get_lines", 1, 5)]
+
+    async def test_evicts_least_recently_read_to_fit(
+        self, edition: StubSource, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        size = len(await self._read("beowulf://text/stub/line/1/5"))
+        monkeypatch.setattr(server, "_RESOURCE_CACHE_CHARS", 2 * size)
+
+        await self._read("beowulf://text/stub/line/2/5")
+        await self._read("beowulf://text/stub/line/1/5")  # now most recent
+        await self._read("beowulf://text/stub/line/3/5")  # evicts 2-5
+
+        assert list(server._resource_json) == [
+            "beowulf://text/stub/line/1/5",
+            "beowulf://text/stub/line/3/5",
+        ]
+        assert server._resource_json_chars == 2 * size
+
+    async def test_oversized_document_not_cached(
+        self, edition: StubSource, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(server, "_RESOURCE_CACHE_CHARS", 10)
+        await self._read("beowulf://text/stub")
+        await self._read("beowulf://text/stub")
+        assert edition.calls.count(("get_lines", 1, None)) == 2
+        assert not server._resource_json
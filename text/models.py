@@ -10,8 +10,15 @@ from typing import Any, Dict, List, Optional
 
 from .numbering import FITT_BOUNDARIES
 
+# Fitt name keyed by the fitt's first line (skipping the non-existent fitt 24)
+FITT_TITLES: Dict[int, str] = {
+    start: name
+    for fitt_id, (start, _end, name) in enumerate(FITT_BOUNDARIES)
+    if fitt_id != 24
+}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class BeowulfLine:
     """Represents a single line of Beowulf text with dual-language content."""
 
@@ -52,26 +59,14 @@ def dict_data_to_beowulf_lines(lines_data: List[Dict[str, Any]]) -> List[Beowulf
     Returns:
         List of BeowulfLine objects
     """
-    beowulf_lines = []
-
-    for line_data in lines_data:
-        line_number = line_data["line"]
-
-        # Check if this line is the start of a fitt (has a title)
-        title = None
-        for fitt_id, fitt_bounds in enumerate(FITT_BOUNDARIES):
-            if fitt_id == 24:  # Skip non-existent fitt 24
-                continue
-            if line_number == fitt_bounds[0]:  # Start line of fitt
-                title = fitt_bounds[2]  # Fitt name
-                break
-
-        line = BeowulfLine(
-            line_number=line_number,
+    # A line that starts a fitt carries the fitt's name as its title
+    titles = FITT_TITLES
+    return [
+        BeowulfLine(
+            line_number=line_data["line"],
             old_english=line_data["OE"],
             modern_english=line_data["ME"],
-            title=title,
+            title=titles.get(line_data["line"]),
         )
-        beowulf_lines.append(line)
-
-    return beowulf_lines
+        for line_data in lines_data
+    ]
@@ -6,7 +6,7 @@ This module contains the fitt boundaries and line number markers
 for the Beowulf text, following the heorot.dk numbering system.
 """
 
-from typing import Final, List, Tuple
+from typing import Dict, Final, List, Tuple
 
 # Fitt boundaries: (start_line, end_line, fitt_name)
 # Note: Fitt 24 doesn't exist in Beowulf, but is included for easier calculations
@@ -60,6 +60,14 @@ FITT_BOUNDARIES: Final[List[Tuple[int, int, str]]] = [
     (3137, 3182, "XLIII"),
 ]
 
+# Fitt number for every line number covered by a fitt (fitt 24 does not exist)
+FITT_OF_LINE: Final[Dict[int, int]] = {
+    line_number: fitt_id
+    for fitt_id, (start_line, end_line, _name) in enumerate(FITT_BOUNDARIES)
+    if fitt_id != 24
+    for line_number in range(start_line, end_line + 1)
+}
+
 
 # Commented out code for reference - this was used to generate the FITT_BOUNDARIES
 # number_markers = {}
@@ -1,17 +1,23 @@
 """Writers package for exporting Beowulf text data to various formats."""
 
-from typing import List
+from typing import Final, List, Tuple, Type
 
-# Import all writer modules to register subclasses
-from writers.ass_writer import AssWriter, write_ass  # noqa: F401
+from writers.ass_writer import AssWriter, write_ass
 from writers.base_writer import BaseWriter
-from writers.csv_writer import CsvWriter, write_csv  # noqa: F401
-from writers.json_writer import JsonWriter, write_json  # noqa: F401
+from writers.csv_writer import CsvWriter, write_csv
+from writers.json_writer import JsonWriter, write_json
+
+# Writers run by get_all_writers(), in output order
+_WRITER_CLASSES: Final[Tuple[Type[BaseWriter], ...]] = (
+    AssWriter,
+    CsvWriter,
+    JsonWriter,
+)
 
 
 def get_all_writers() -> List[BaseWriter]:
-    """Return instances of all BaseWriter subclasses."""
-    return [writer_class() for writer_class in BaseWriter.__subclasses__()]
+    """Return instances of all registered writers."""
+    return [writer_class() for writer_class in _WRITER_CLASSES]
 
 
 __all__ = [
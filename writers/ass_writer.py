@@ -1,15 +1,19 @@
 """ASS subtitle generation for Beowulf text."""
 
+import copy
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, Final, List
-
-import pysubs2
+from typing import TYPE_CHECKING, Any, Dict, Final, FrozenSet, List, Union, cast
 
 from assets import get_asset_path
 from text.models import BeowulfLine, dict_data_to_beowulf_lines
-from text.numbering import FITT_BOUNDARIES
+from text.numbering import FITT_BOUNDARIES, FITT_OF_LINE
 from writers.base_writer import BaseWriter
 
+if TYPE_CHECKING:
+    # Imported where used, so the JSON/CSV writers don't load pysubs2
+    import pysubs2
+
 # Timing constants
 SECONDS_PER_LINE: Final[int] = 4
 
@@ -26,61 +30,77 @@ ASS_STYLES: Final[Dict[str, str]] = {
 }
 
 # Line number markers for special display
-# These lines get special formatting in the subtitles
+# These lines get their number shown big in the subtitles
 # Generated as every 5th line from 5 to 3178, plus some specific irregular ones
-LINE_NUMBER_MARKERS: Final[Dict[int, int]] = {
-    line: line for line in range(5, 3179, 5)
-} | {
+LINE_NUMBER_MARKERS: Final[FrozenSet[int]] = frozenset(range(5, 3179, 5)) | {
     # Add specific irregular markers
-    391: 391,
-    1173: 1173,
-    1707: 1707,
-    2230: 2230,
-    2234: 2234,
-    2998: 2998,
+    391,
+    1173,
+    1707,
+    2230,
+    2234,
+    2998,
 }
 
 
-def get_fitt(fitt_num: int, lines: List[BeowulfLine]) -> List[BeowulfLine]:
+def split_fitts(lines: List[BeowulfLine]) -> Dict[int, List[BeowulfLine]]:
     """
-    Extract BeowulfLine objects for a specific fitt.
+    Group BeowulfLine objects by fitt in a single pass.
+
+    Each line goes to the fitt whose FITT_BOUNDARIES range contains it, so
+    all lines are scanned once rather than once per fitt.
 
     Args:
-        fitt_num: The fitt number to extract
         lines: List of all BeowulfLine objects
 
     Returns:
-        List of BeowulfLine objects for the specified fitt
+        Dict of fitt number to the lines in that fitt, in input order
     """
-    start_line = FITT_BOUNDARIES[fitt_num][0]
-    end_line = FITT_BOUNDARIES[fitt_num][1]
-
-    return [line for line in lines if start_line <= line.line_number <= end_line]
-
-
-def make_sub(
-    text: str, start_time: float, end_time: float, style: str
-) -> pysubs2.SSAEvent:
+    fitts: Dict[int, List[BeowulfLine]] = {}
+    fitt_of = FITT_OF_LINE
+    for line in lines:
+        fitt_id = fitt_of.get(line.line_number)
+        if fitt_id is not None:
+            fitts.setdefault(fitt_id, []).append(line)
+    return fitts
+
+
+@lru_cache(maxsize=1)
+def _blank_template() -> "pysubs2.SSAFile":
+    """Load and clear the blank.ass template once; copy it for each fitt."""
+    import pysubs2
+
+    subs = pysubs2.load(str(get_asset_path("blank.ass")), encoding="UTF-8")
+    subs.clear()
+    return subs
+
+
+def _make_event(
+    event_cls: "type[pysubs2.SSAEvent]",
+    text: str,
+    start_ms: int,
+    end_ms: int,
+    style_name: str,
+    name: str,
+) -> "pysubs2.SSAEvent":
     """
     Create a subtitle event.
 
+    The caller passes pysubs2.SSAEvent in, so pysubs2 is imported once per
+    fitt rather than once per event.
+
     Args:
+        event_cls: pysubs2.SSAEvent
         text: The subtitle text
-        start_time: Start time in seconds
-        end_time: End time in seconds
-        style: Style name for the subtitle
+        start_ms: Start time in milliseconds (see pysubs2.make_time)
+        end_ms: End time in milliseconds
+        style_name: ASS style name, a value of ASS_STYLES
+        name: Event name, the matching ASS_STYLES key
 
     Returns:
         SSAEvent object for the subtitle
     """
-    subtitle = pysubs2.SSAEvent(
-        start=pysubs2.make_time(s=start_time),
-        end=pysubs2.make_time(s=end_time),
-        style=ASS_STYLES[style],
-    )
-    subtitle.name = style
-    subtitle.text = text
-    return subtitle
+    return event_cls(start=start_ms, end=end_ms, style=style_name, name=name, text=text)
 
 
 class AssWriter(BaseWriter):
@@ -98,15 +118,25 @@ class AssWriter(BaseWriter):
         # ASS writer outputs to its own subtitles directory
         return SUBTITLE_DIR
 
-    def write(self, lines: List[Dict[str, Any]], output_path: Path) -> None:
+    def write(
+        self,
+        lines: Union[List[Dict[str, Any]], List[BeowulfLine]],
+        output_path: Path,
+    ) -> None:
         """
         Generate ASS subtitle files for each fitt.
 
         Args:
-            lines: List of all line data
+            lines: List of all line data, as parsed dicts or BeowulfLine objects
             output_path: Directory to write subtitle files to
         """
-        beowulf_lines = dict_data_to_beowulf_lines(lines)
+        if lines and isinstance(lines[0], BeowulfLine):
+            beowulf_lines = cast(List[BeowulfLine], lines)  # already converted
+        else:
+            beowulf_lines = dict_data_to_beowulf_lines(
+                cast(List[Dict[str, Any]], lines)
+            )
+        fitts = split_fitts(beowulf_lines)
         total_subs = 0
         output_path.mkdir(parents=True, exist_ok=True)
 
@@ -114,7 +144,7 @@ class AssWriter(BaseWriter):
             if fitt_id == 24:
                 continue  # there's no 24 in Beowulf
 
-            fitt = get_fitt(fitt_id, beowulf_lines)
+            fitt = fitts.get(fitt_id, [])
             fitt_output_path = output_path / f"fitt_{fitt_id}.ass"
 
             self.logger.info(
@@ -138,53 +168,60 @@ class AssWriter(BaseWriter):
 
     def _create_fitt_subtitles(
         self, fitt_id: int, fitt: List[BeowulfLine]
-    ) -> pysubs2.SSAFile:
+    ) -> "pysubs2.SSAFile":
         """Create subtitle file for a single fitt."""
-        blank_template_path = get_asset_path("blank.ass")
-        subs = pysubs2.load(str(blank_template_path), encoding="UTF-8")
-        subs.clear()
+        import pysubs2
+
+        # A shallow copy is enough: info gets per-fitt keys and events are
+        # replaced below, while the styles are only read when saving
+        template = _blank_template()
+        subs = copy.copy(template)
+        subs.info = dict(template.info)
+        subs.styles = dict(template.styles)
         subs.info["Fitt"] = str(fitt_id)
         subs.info["First Line"] = fitt[0].line_number
         subs.info["Last Line"] = fitt[-1].line_number
 
-        start_time = 0
-        end_time = start_time + SECONDS_PER_LINE
-
-        for line in fitt:
-            subs.append(
-                make_sub(line.old_english, start_time, end_time, "original_style")
-            )
-            subs.append(
-                make_sub(line.modern_english, start_time, end_time, "modern_style")
-            )
-            subs.append(
-                make_sub(
-                    str(line.line_number), start_time, end_time, "all_number_style"
-                )
+        # Every event for a line shares its start/end, so convert those once
+        line_ms = pysubs2.make_time(s=SECONDS_PER_LINE)
+        # Collect events in a plain list: SSAFile.append goes through
+        # MutableSequence.append -> len() -> insert() -> isinstance() per event
+        events: List[pysubs2.SSAEvent] = []
+        append = events.append
+        markers = LINE_NUMBER_MARKERS
+        # Resolve the event class and style names once rather than per event
+        event = partial(_make_event, pysubs2.SSAEvent)
+        original = ASS_STYLES["original_style"]
+        modern = ASS_STYLES["modern_style"]
+        all_number = ASS_STYLES["all_number_style"]
+        big_number = ASS_STYLES["big_number_style"]
+        heading = ASS_STYLES["fitt_heading_style"]
+
+        for index, line in enumerate(fitt):
+            start_ms = index * line_ms
+            end_ms = start_ms + line_ms
+            line_number = line.line_number
+            number = str(line_number)
+
+            append(
+                event(line.old_english, start_ms, end_ms, original, "original_style")
             )
+            append(event(line.modern_english, start_ms, end_ms, modern, "modern_style"))
+            append(event(number, start_ms, end_ms, all_number, "all_number_style"))
 
-            if line.line_number in LINE_NUMBER_MARKERS:
-                subs.append(
-                    make_sub(
-                        str(LINE_NUMBER_MARKERS[line.line_number]),
-                        start_time,
-                        end_time,
-                        "big_number_style",
-                    )
-                )
+            if line_number in markers:
+                append(event(number, start_ms, end_ms, big_number, "big_number_style"))
 
-            if line.is_title_line:
-                subs.append(
-                    make_sub(line.title, start_time, end_time, "fitt_heading_style")
+            if line.title is not None:
+                append(
+                    event(line.title, start_ms, end_ms, heading, "fitt_heading_style")
                 )
 
-            start_time += SECONDS_PER_LINE
-            end_time += SECONDS_PER_LINE
-
+        subs.events = events
         return subs
 
 
 # Convenience function for backward compatibility
-def write_ass(lines: List[Dict[str, Any]]) -> None:
+def write_ass(lines: Union[List[Dict[str, Any]], List[BeowulfLine]]) -> None:
     """Generate ASS subtitle files for each fitt."""
     AssWriter().write(lines, SUBTITLE_DIR)
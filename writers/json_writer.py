@@ -26,8 +26,10 @@ class JsonWriter(BaseWriter):
             output_path: Path to the output JSON file
         """
         self._log_write_start(output_path)
-        with output_path.open("w", encoding="utf-8") as json_file:
-            json.dump(lines, json_file, indent=4, ensure_ascii=False)
+        # Encode in one piece and write once; json.dump() would issue a
+        # separate write() for every token of the indented output
+        text = json.dumps(lines, indent=4, ensure_ascii=False)
+        output_path.write_text(text, encoding="utf-8")
         self._log_write_complete(output_path, len(lines))
 
 